@@ -1,7 +1,316 @@
 #fantasy football watchlist
-def watchlist_manager():
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from bisect import bisect_left, insort
+from collections import Counter
 
-    player_watchlist = []
+# per-user file, so running the script never drops a database into the working directory
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".fantasy_watchlist.db")
+
+
+def normalize_name(name):
+    # the watchlist key: trimmed and title-cased
+    return name.strip().title()
+
+
+class PlayerSearchIndex:
+    """Trigram index for typo-tolerant player lookups.
+
+    Each name is split into padded, case-folded trigrams ("  p", " pa", "pat",
+    ...). A query collects candidates from its rarest trigrams first, then
+    ranks them by how much of the query they cover. Single names are indexed
+    and unindexed in place; the constructor builds the index in one pass.
+    """
+
+    def __init__(self, names=()):
+        self._grams = grams_index = {}
+        self._name_grams = name_grams = {}
+        trigrams = self.trigrams
+        for name in names:
+            grams = name_grams[name] = trigrams(name)
+            for gram in grams:
+                bucket = grams_index.get(gram)
+                if bucket is None:
+                    grams_index[gram] = {name}
+                else:
+                    bucket.add(name)
+
+    @staticmethod
+    def trigrams(name):
+        padded = f"  {name.casefold()} "
+        return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    def add(self, name):
+        grams = self.trigrams(name)
+        self._name_grams[name] = grams
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(name)
+
+    def remove(self, name):
+        for gram in self._name_grams.pop(name, ()):
+            bucket = self._grams[gram]
+            bucket.discard(name)
+            if not bucket:
+                del self._grams[gram]
+
+    def suggest(self, query, limit=5, budget=5_000, min_score=0.3):
+        # returns up to 'limit' names, best query coverage first
+        query_grams = self.trigrams(query)
+        buckets = sorted((self._grams[gram] for gram in query_grams if gram in self._grams), key=len)
+        overlap = Counter()
+        touched = 0
+        for bucket in buckets:
+            # common trigrams ("  j", " jo") add little but cost a lot
+            if touched and touched + len(bucket) > budget:
+                break
+            overlap.update(bucket)
+            touched += len(bucket)
+
+        ranked = []
+        for name, _ in overlap.most_common(100):
+            grams = self._name_grams[name]
+            shared = len(query_grams & grams)
+            coverage = shared / len(query_grams)
+            if coverage >= min_score:
+                ranked.append((-coverage, -shared / len(query_grams | grams), name))
+        ranked.sort()
+        return [name for _, _, name in ranked[:limit]]
+
+
+class SortedWatchlist:
+    """In-memory watchlist kept permanently sorted.
+
+    Names live in a compact list maintained with bisect insertion, plus a set
+    for constant-time duplicate checks, so viewing is a plain traversal with
+    no re-sort. The trigram index is built on the first fuzzy search and
+    dropped by batches, so bulk loads never pay for it name by name.
+    """
+
+    def __init__(self, names=()):
+        self._members = {normalize_name(name) for name in names}
+        self._names = sorted(self._members)
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = PlayerSearchIndex(self._names)
+        return self._index
+
+    def add(self, name):
+        # returns False if the player is already on the watchlist
+        name = normalize_name(name)
+        if name in self._members:
+            return False
+        self._members.add(name)
+        insort(self._names, name)
+        if self._index is not None:
+            self._index.add(name)
+        return True
+
+    def remove(self, name):
+        # returns False if the player was not on the watchlist
+        name = normalize_name(name)
+        if name not in self._members:
+            return False
+        self._members.remove(name)
+        del self._names[bisect_left(self._names, name)]
+        if self._index is not None:
+            self._index.remove(name)
+        return True
+
+    def apply_batch(self, commands):
+        """Applies ('add' | 'remove', name) pairs in order with one re-sort.
+
+        Returns the net sets of added and removed names plus how many adds were
+        duplicates and how many removes were not on the watchlist.
+        """
+        members = self._members
+        before = set(members)
+        duplicates = missing = 0
+        for action, name in commands:
+            if action == "add":
+                if name in members:
+                    duplicates += 1
+                else:
+                    members.add(name)
+            elif name in members:
+                members.remove(name)
+            else:
+                missing += 1
+        self._names = sorted(members)
+        added = members - before
+        removed = before - members
+        # rebuilt in one pass by the next fuzzy search
+        self._index = None
+        return {
+            "added": added,
+            "removed": removed,
+            "duplicates": duplicates,
+            "missing": missing,
+        }
+
+    def search(self, query, limit=5):
+        """Returns names starting with 'query' (in order), then fuzzy matches."""
+        query = normalize_name(query)
+        if not query:
+            return []
+        start = bisect_left(self._names, query)
+        matches = []
+        for name in self._names[start:start + limit]:
+            if not name.startswith(query):
+                break
+            matches.append(name)
+        if len(matches) < limit:
+            for name in self.index.suggest(query, limit):
+                if name not in matches:
+                    matches.append(name)
+        return matches[:limit]
+
+    def __contains__(self, name):
+        return normalize_name(name) in self._members
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+
+class WatchlistStore:
+    """Persistent watchlist backed by SQLite.
+
+    Players live in a WITHOUT ROWID table whose primary key (user, name) is a
+    B-tree, so writes are O(log n). The user's list is mirrored in a
+    SortedWatchlist for lookups and listing. Every write bumps the user's row
+    in watchlist_versions in the same transaction, and the mirror is reloaded
+    only when that version moved, so other users' commits cost one indexed
+    read instead of a reload. add/remove results come from the row counts.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, user="default"):
+        self.user = user
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS watchlist ("
+            " user TEXT NOT NULL,"
+            " name TEXT NOT NULL,"
+            " PRIMARY KEY (user, name)"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS watchlist_versions ("
+            " user TEXT PRIMARY KEY,"
+            " version INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.commit()
+        self._data_version = None
+        self._version = None
+        self.reloads = 0
+        self._sync()
+
+    def _user_version(self):
+        row = self.conn.execute(
+            "SELECT version FROM watchlist_versions WHERE user = ?", (self.user,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _sync(self):
+        # data_version only moves when another connection commits; then the
+        # user's own version says whether that commit touched this list
+        (data_version,) = self.conn.execute("PRAGMA data_version").fetchone()
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+        version = self._user_version()
+        if version != self._version:
+            self._version = version
+            cur = self.conn.execute("SELECT name FROM watchlist WHERE user = ?", (self.user,))
+            self.players = SortedWatchlist(name for (name,) in cur)
+            self.reloads += 1
+
+    def _bump_version(self):
+        # called inside the write transaction, after _sync, so no other
+        # writer can slip in between the mirror and the new version
+        self.conn.execute(
+            "INSERT INTO watchlist_versions (user, version) VALUES (?, 1)"
+            " ON CONFLICT (user) DO UPDATE SET version = version + 1",
+            (self.user,),
+        )
+        self._version = self._user_version()
+
+    def _write(self, sql, name):
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._sync()
+            cur = self.conn.execute(sql, (self.user, name))
+            if cur.rowcount:
+                self._bump_version()
+        return cur.rowcount == 1
+
+    def add(self, name):
+        # returns False if the player is already on the watchlist
+        name = normalize_name(name)
+        added = self._write("INSERT OR IGNORE INTO watchlist (user, name) VALUES (?, ?)", name)
+        # either way the row is in the database now; keep the mirror in step
+        self.players.add(name)
+        return added
+
+    def remove(self, name):
+        # returns False if the player was not on the watchlist
+        name = normalize_name(name)
+        removed = self._write("DELETE FROM watchlist WHERE user = ? AND name = ?", name)
+        self.players.remove(name)
+        return removed
+
+    def apply_batch(self, commands):
+        # same contract as SortedWatchlist.apply_batch, persisted in one transaction;
+        # the write lock is taken first so the mirror cannot go stale mid-batch
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._sync()
+            result = self.players.apply_batch(commands)
+            self.conn.executemany(
+                "DELETE FROM watchlist WHERE user = ? AND name = ?",
+                ((self.user, name) for name in result["removed"]),
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO watchlist (user, name) VALUES (?, ?)",
+                ((self.user, name) for name in result["added"]),
+            )
+            if result["added"] or result["removed"]:
+                self._bump_version()
+        return result
+
+    def search(self, query, limit=5):
+        self._sync()
+        return self.players.search(query, limit)
+
+    def __contains__(self, name):
+        self._sync()
+        return name in self.players
+
+    def __len__(self):
+        self._sync()
+        return len(self.players)
+
+    def __iter__(self):
+        self._sync()
+        return iter(self.players)
+
+    def close(self):
+        self.conn.close()
+
+
+def watchlist_manager(db_path=DEFAULT_DB_PATH, user="default"):
+
+    player_watchlist = WatchlistStore(db_path, user)
     
     print("Fantasy Fottball Watchlist")
     
@@ -10,23 +319,25 @@ def watchlist_manager():
         print("1: Add a player to the watchlist")
         print("2: View current watchlist")
         print("3: Remove a player from the watchlist")
-        print("4: Quit")
+        print("4: Search the watchlist")
+        print("5: Quit")
         
-        choice = input("Enter your choice (1, 2, 3, or 4): ").strip()
+        choice = input("Enter your choice (1, 2, 3, 4, or 5): ").strip()
         
         if choice == '1':
             new_player = input("Enter the player's name to add: ").strip()
             if new_player: 
-                new_player_formatted = new_player.title()
-                player_watchlist.append(new_player_formatted)
-                print(f"'{new_player_formatted}' has been added to the watchlist.")
+                new_player_formatted = normalize_name(new_player)
+                if player_watchlist.add(new_player_formatted):
+                    print(f"'{new_player_formatted}' has been added to the watchlist.")
+                else:
+                    print(f"'{new_player_formatted}' is already on the watchlist.")
             else:
                 print("Player name cannot be empty.")
                 
         elif choice == '2':
-            if player_watchlist:
+            if len(player_watchlist):
                 print("\n--- Current Watchlist ---")
-                player_watchlist.sort()
                 for index, player in enumerate(player_watchlist, start=1):
                     print(f"{index}. {player}")
                 print("-------------------------")
@@ -34,33 +345,306 @@ def watchlist_manager():
                 print("Your watchlist is currently empty.")
 
         elif choice == '3':
-            if not player_watchlist:
+            if not len(player_watchlist):
                 print("The watchlist is empty. Nothing to remove.")
                 continue # main menu return fxn
 
-            # display fxn
+            # display fxn (store keeps names sorted)
             print("\n--- Current Watchlist for Removal ---")
-            player_watchlist.sort() # sort fxn
             for index, player in enumerate(player_watchlist, start=1):
                 print(f"{index}. {player}")
             print("-----------------------------------")
             
-            player_to_remove = input("Enter the full name of the player to remove: ").strip().title()
+            player_to_remove = normalize_name(input("Enter the full name of the player to remove: "))
             
-            if player_to_remove in player_watchlist:
-                player_watchlist.remove(player_to_remove)
+            if player_watchlist.remove(player_to_remove):
                 print(f"'{player_to_remove}' has been successfully removed from the watchlist.")
             else:
                 print(f"Error: '{player_to_remove}' was not found on the watchlist.")
+                suggestions = player_watchlist.search(player_to_remove)
+                if suggestions:
+                    print("Did you mean: " + ", ".join(suggestions) + "?")
                 
         elif choice == '4':
+            # search fxn: prefix matches first, then closest spellings
+            query = input("Enter part of a player's name to search for: ")
+            results = player_watchlist.search(query)
+            if results:
+                print("\n--- Search Results ---")
+                for index, player in enumerate(results, start=1):
+                    print(f"{index}. {player}")
+                print("----------------------")
+            else:
+                print("No matching players found.")
+
+        elif choice == '5':
             # Quit fxn
+            player_watchlist.close()
             print("Watchlist Management Complete")
             break 
             
         else:
             # For invalid inputs
-            print("Invalid choice. Please enter 1, 2, 3, or 4.")
+            print("Invalid choice. Please enter 1, 2, 3, 4, or 5.")
+
+
+def run_batch(lines, player_watchlist, out=sys.stdout):
+    # non-interactive mode: one "add <name>", "remove <name>" or "list" per line
+    commands = []
+    errors = []
+    want_list = False
+    for line_number, line in enumerate(lines, start=1):
+        action, _, name = line.strip().partition(" ")
+        action = action.lower()
+        if action in ("add", "remove"):
+            name = normalize_name(name)
+            if name:
+                commands.append((action, name))
+            else:
+                errors.append(f"line {line_number}: player name cannot be empty")
+        elif action == "list":
+            want_list = True
+        elif action and not action.startswith("#"):
+            errors.append(f"line {line_number}: unknown command '{action}'")
+
+    result = player_watchlist.apply_batch(commands)
+
+    # one consolidated report, written at once
+    report = [
+        "--- Batch Result ---",
+        f"Commands applied: {len(commands)}",
+        f"Players added: {len(result['added'])}",
+        f"Players removed: {len(result['removed'])}",
+        f"Already on watchlist: {result['duplicates']}",
+        f"Not found for removal: {result['missing']}",
+        f"Invalid lines: {len(errors)}",
+    ]
+    report.extend(f"  {error}" for error in errors[:10])
+    if len(errors) > 10:
+        report.append(f"  ... {len(errors) - 10} more")
+    if want_list:
+        report.append("--- Current Watchlist ---")
+        report.extend(f"{index}. {player}" for index, player in enumerate(player_watchlist, start=1))
+    report.append("-------------------------")
+    out.write("\n".join(report) + "\n")
+    return result
+
+
+class WatchlistService:
+    """Multi-user watchlist server speaking JSON lines over TCP.
+
+    Requests look like {"op": "add", "user": "kinan", "name": "josh allen"}
+    with op one of add, view, remove or search; every reply is one JSON line
+    with an "ok" field. Each user gets an isolated watchlist. Operations never
+    await mid-update, so concurrent writers are serialized by the event loop.
+    """
+
+    def __init__(self, db_path=None):
+        # db_path=None keeps every watchlist in memory
+        self.db_path = db_path
+        self.watchlists = {}
+
+    def watchlist_for(self, user):
+        watchlist = self.watchlists.get(user)
+        if watchlist is None:
+            if self.db_path is None:
+                watchlist = SortedWatchlist()
+            else:
+                watchlist = WatchlistStore(self.db_path, user)
+            self.watchlists[user] = watchlist
+        return watchlist
+
+    def handle_request(self, request):
+        op = request.get("op")
+        user = request.get("user")
+        if not isinstance(user, str) or not user:
+            return {"ok": False, "error": "a user is required"}
+        watchlist = self.watchlist_for(user)
+
+        if op == "view":
+            return {"ok": True, "players": list(watchlist)}
+        name = normalize_name(str(request.get("name", "")))
+        if not name:
+            return {"ok": False, "error": "player name cannot be empty"}
+        if op == "add":
+            if watchlist.add(name):
+                return {"ok": True, "name": name}
+            return {"ok": False, "error": f"'{name}' is already on the watchlist"}
+        if op == "remove":
+            if watchlist.remove(name):
+                return {"ok": True, "name": name}
+            return {"ok": False, "error": f"'{name}' was not found on the watchlist",
+                    "suggestions": watchlist.search(name)}
+        if op == "search":
+            return {"ok": True, "players": watchlist.search(name)}
+        return {"ok": False, "error": f"unknown op '{op}'"}
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                    reply = self.handle_request(request)
+                except ValueError as e:
+                    reply = {"ok": False, "error": f"bad request: {e}"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8505):
+        return await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+
+    def close(self):
+        for watchlist in self.watchlists.values():
+            if isinstance(watchlist, WatchlistStore):
+                watchlist.close()
+
+
+async def _serve(port, db_path):
+    service = WatchlistService(db_path)
+    server = await service.start(port=port)
+    print(f"Watchlist service listening on port {port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+async def _simulated_client(host, port, user, ops, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random(user)
+    players = [f"player {rng.randrange(1_000)}" for _ in range(ops)]
+    for i, player in enumerate(players):
+        op = ("add", "add", "view", "search", "remove")[i % 5]
+        request = json.dumps({"op": op, "user": user, "name": player}).encode() + b"\n"
+        start = time.perf_counter()
+        writer.write(request)
+        await writer.drain()
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _load_test(clients, ops, users):
+    service = WatchlistService()
+    server = await service.start(port=0)
+    host, port = server.sockets[0].getsockname()[:2]
+    latencies = []
+    start = time.perf_counter()
+    async with server:
+        await asyncio.gather(*(
+            _simulated_client(host, port, f"user{i % users}", ops, latencies)
+            for i in range(clients)
+        ))
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def load_test(clients=2_000, ops=20, users=200):
+    # many concurrent clients sharing 'users' watchlists against one service
+    latencies, elapsed = asyncio.run(_load_test(clients, ops, users))
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"--- Load Test ({clients:,} clients, {ops} ops each, {users} users) ---")
+    print(f"Requests: {len(latencies):,} in {elapsed:.2f}s ({len(latencies) / elapsed:,.0f}/s)")
+    print(f"Latency p50: {p50:.2f}ms  p99: {p99:.2f}ms")
+
+
+def benchmark_watchlist(count=100_000, views=20, removals=1_000):
+    # compares the original list-plus-sort behaviour with SortedWatchlist
+    rng = random.Random(505)
+    names = [f"Player {rng.randrange(10**9):09d}" for _ in range(count)]
+    to_remove = rng.sample(names, removals)
+    view_every = count // views
+
+    start = time.perf_counter()
+    plain = []
+    for i, name in enumerate(names, start=1):
+        plain.append(name)
+        if i % view_every == 0:
+            plain.sort()
+            for _ in plain:
+                pass
+    for name in to_remove:
+        plain.sort()
+        if name in plain:
+            plain.remove(name)
+    list_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    watchlist = SortedWatchlist()
+    for i, name in enumerate(names, start=1):
+        watchlist.add(name)
+        if i % view_every == 0:
+            for _ in watchlist:
+                pass
+    for name in to_remove:
+        watchlist.remove(name)
+    sorted_seconds = time.perf_counter() - start
+
+    print(f"--- Watchlist Benchmark ({count:,} players, {views} views, {removals:,} removals) ---")
+    print(f"List + sort:     {list_seconds:.3f}s")
+    print(f"SortedWatchlist: {sorted_seconds:.3f}s ({list_seconds / sorted_seconds:.1f}x)")
+
+
+def check_store_isolation(players=5_000, other_writes=200):
+    # two users share one database file; only same-user writes may reload
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "watchlist.db")
+        a = WatchlistStore(db_path, "a")
+        a.apply_batch(("add", f"Player {i:06d}") for i in range(players))
+        b = WatchlistStore(db_path, "b")
+        a_writer = WatchlistStore(db_path, "a")
+        reloads = a.reloads
+        start = time.perf_counter()
+        for i in range(other_writes):
+            b.add(f"Other {i:04d}")
+            assert f"Player {i:06d}" in a
+        seconds = time.perf_counter() - start
+        assert a.reloads == reloads, "a write by another user reloaded the list"
+        assert len(a) == players and len(b) == other_writes
+        a_writer.add("Late Signing")
+        assert "Late Signing" in a and a.reloads == reloads + 1
+        for store in (a, b, a_writer):
+            store.close()
+    print(f"Store isolation OK: {other_writes} writes by another user, "
+          f"0 reloads, {seconds * 1000:.1f}ms")
+
 
 if __name__ == "__main__":
-    watchlist_manager()
\ No newline at end of file
+    if sys.argv[1:2] == ["--benchmark"]:
+        benchmark_watchlist()
+    elif sys.argv[1:2] == ["--check"]:
+        check_store_isolation()
+    elif sys.argv[1:2] == ["--serve"]:
+        # args: --serve [port] [database path]
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8505
+        db_path = sys.argv[3] if len(sys.argv) > 3 else None
+        try:
+            asyncio.run(_serve(port, db_path))
+        except KeyboardInterrupt:
+            pass
+    elif sys.argv[1:2] == ["--load-test"]:
+        # args: --load-test [clients]
+        load_test(int(sys.argv[2]) if len(sys.argv) > 2 else 2_000)
+    elif sys.argv[1:2] == ["--batch"]:
+        # args: --batch <command file or -> [database path] [user name]
+        source = sys.stdin if sys.argv[2] == "-" else open(sys.argv[2])
+        store = WatchlistStore(*sys.argv[3:5])
+        run_batch(source, store)
+        store.close()
+    else:
+        # optional args: database path, user name
+        watchlist_manager(*sys.argv[1:3])
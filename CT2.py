@@ -1,10 +1,249 @@
+import json
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import namedtuple
+
+REPORT_FORMATS = ("text", "markdown", "json")
+
+# (report label, iteration key) pairs for the markdown sprint sections
+SPRINT_FIELDS = [
+    ("Features Developed", "Features"),
+    ("Modeling Time", "DesignTime"),
+    ("Construction Time", "ConstructionTime"),
+    ("Test Coverage", "TestCoverage"),
+    ("Feedback for Next Sprint", "Feedback"),
+]
+
+# Iteration fields that must hold numbers (weeks, weeks, percent)
+NUMERIC_SPRINT_FIELDS = ("DesignTime", "ConstructionTime", "TestCoverage")
+
+# iteration key -> SprintRecord attribute
+SPRINT_ATTRIBUTES = {
+    "Sprint": "sprint",
+    "Features": "features",
+    "DesignTime": "design_time",
+    "ConstructionTime": "construction_time",
+    "TestCoverage": "test_coverage",
+    "Feedback": "feedback",
+}
+
+NAN = float("nan")
+
+
+def _parse_number(text):
+    # blank or unparseable input is kept as NaN; "90%" reads as 90.0
+    try:
+        return float(text.strip().rstrip('%'))
+    except ValueError:
+        return NAN
+
+
+def _field_text(value):
+    # imported values as the interactive prompts would store them; JSON null is a blank
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _format_number(value):
+    return "" if value != value else f"{value:g}"
+
+
+class SprintRecord:
+    """
+    One sprint with typed numeric fields. Reads like the old iteration dict
+    (record['DesignTime']) so reports show exactly what was entered; the
+    original text is only kept when it differs from the formatted number.
+    """
+    __slots__ = ("sprint", "features", "design_time", "construction_time",
+                 "test_coverage", "feedback", "_raw")
+
+    def __init__(self, sprint, features="", design_time=NAN, construction_time=NAN,
+                 test_coverage=NAN, feedback=""):
+        self.sprint = sprint
+        self.features = features
+        self.design_time = design_time
+        self.construction_time = construction_time
+        self.test_coverage = test_coverage
+        self.feedback = feedback
+        self._raw = None
+
+    @classmethod
+    def from_dict(cls, data, strict=False):
+        record = cls(data.get('Sprint'))
+        record.update(data, strict=strict)
+        return record
+
+    def update(self, fields=(), strict=False, **more):
+        for key, value in dict(fields, **more).items():
+            attribute = SPRINT_ATTRIBUTES[key]
+            if key not in NUMERIC_SPRINT_FIELDS:
+                setattr(self, attribute, value)
+                continue
+            text = value if isinstance(value, str) else str(value)
+            number = _parse_number(text)
+            # a blank value means "not recorded", as at the interactive prompts
+            if strict and number != number and text.strip():
+                raise ValueError(f"Sprint {self.sprint}: {key} must be a number, got {text!r}")
+            setattr(self, attribute, number)
+            if _format_number(number) != text:
+                if self._raw is None:
+                    self._raw = {}
+                self._raw[key] = text
+            elif self._raw is not None:
+                self._raw.pop(key, None)
+
+    def __getitem__(self, key):
+        if self._raw is not None and key in self._raw:
+            return self._raw[key]
+        value = getattr(self, SPRINT_ATTRIBUTES[key])
+        return _format_number(value) if key in NUMERIC_SPRINT_FIELDS else value
+
+    def as_dict(self):
+        return {key: self[key] for key in SPRINT_ATTRIBUTES}
+
+
+SprintMetrics = namedtuple("SprintMetrics", [
+    "sprints", "total_design_time", "total_construction_time",
+    "average_design_time", "average_construction_time",
+    "average_coverage", "coverage_trend",
+    "initial_estimate", "estimate_variance", "estimate_variance_pct",
+])
+
+
+def _require_numpy():
+    # NumPy is only needed for sprint metrics; reports and imports run without it
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Sprint metrics need NumPy (pip install numpy)") from None
+    return numpy
+
+
+class SprintColumns:
+    """
+    The numeric sprint fields as contiguous float64 arrays (NaN for blank or
+    non-numeric input), kept in step with Khader.iterations so metrics can
+    view them with NumPy without copying.
+    """
+    __slots__ = ("design_time", "construction_time", "test_coverage")
+
+    def __init__(self):
+        self.design_time = array('d')
+        self.construction_time = array('d')
+        self.test_coverage = array('d')
+
+    def append(self, record):
+        self.design_time.append(record.design_time)
+        self.construction_time.append(record.construction_time)
+        self.test_coverage.append(record.test_coverage)
+
+    def set(self, position, record):
+        self.design_time[position] = record.design_time
+        self.construction_time[position] = record.construction_time
+        self.test_coverage[position] = record.test_coverage
+
+    def __len__(self):
+        return len(self.design_time)
+
+
+def compute_sprint_metrics(columns, initial_estimate=NAN):
+    """
+    Vectorised aggregates over SprintColumns. coverage_trend is the
+    least-squares slope of test coverage per sprint (percentage points);
+    estimate_variance is actual weeks (design + construction) minus the
+    initial estimate. NaN fields (blank or non-numeric input) are skipped.
+    """
+    np = _require_numpy()
+    design = np.frombuffer(columns.design_time, dtype=np.float64)
+    build = np.frombuffer(columns.construction_time, dtype=np.float64)
+    coverage = np.frombuffer(columns.test_coverage, dtype=np.float64)
+
+    design_count = int(np.count_nonzero(~np.isnan(design)))
+    build_count = int(np.count_nonzero(~np.isnan(build)))
+    design_total = float(np.nansum(design))
+    build_total = float(np.nansum(build))
+
+    sprint_index = np.flatnonzero(~np.isnan(coverage)).astype(np.float64)
+    covered = coverage[~np.isnan(coverage)]
+    trend = 0.0
+    if covered.size:
+        x = sprint_index - sprint_index.mean()
+        spread = float(np.dot(x, x))
+        if spread:
+            trend = float(np.dot(x, covered - covered.mean())) / spread
+
+    variance = design_total + build_total - initial_estimate
+    return SprintMetrics(
+        sprints=len(columns),
+        total_design_time=design_total,
+        total_construction_time=build_total,
+        average_design_time=design_total / design_count if design_count else NAN,
+        average_construction_time=build_total / build_count if build_count else NAN,
+        average_coverage=float(covered.mean()) if covered.size else NAN,
+        coverage_trend=trend,
+        initial_estimate=initial_estimate,
+        estimate_variance=variance,
+        estimate_variance_pct=variance / initial_estimate * 100 if initial_estimate else NAN,
+    )
+
+
 class Khader:
     def __init__(self, project_name="Untitled Project"):
         self.project_name = project_name
         self.communication_data = {}
         self.planning_data = {}
         self.iterations = []
+        self.sprint_columns = SprintColumns()
         self.final_deployment_date = None
+        # rendered sprint sections per format; None marks a section to re-render
+        self._sprint_sections = {fmt: [] for fmt in REPORT_FORMATS}
+
+    @classmethod
+    def from_records(cls, record):
+        """
+        Builds a project from a dict shaped like render_report("json") output:
+        project_name, communication, planning, iterations, final_deployment_date.
+        Record shapes and numeric sprint fields are validated while loading;
+        problems raise ValueError. Blank, null or missing numbers are kept as
+        not recorded.
+        """
+        if not isinstance(record, dict):
+            raise ValueError(f"Project must be a JSON object, got {type(record).__name__}")
+        for section in ("communication", "planning"):
+            if not isinstance(record.get(section, {}), dict):
+                raise ValueError(f"'{section}' must be a JSON object")
+        if not isinstance(record.get("iterations", []), list):
+            raise ValueError("'iterations' must be a JSON array")
+
+        project = cls(project_name=record.get("project_name", "Untitled Project"))
+        project.communication_data = {key: _field_text(value) for key, value in record.get("communication", {}).items()}
+        project.planning_data = {key: _field_text(value) for key, value in record.get("planning", {}).items()}
+
+        for position, sprint in enumerate(record.get("iterations", []), start=1):
+            if not isinstance(sprint, dict):
+                raise ValueError(f"Iteration {position} must be a JSON object, got {type(sprint).__name__}")
+            iteration_data = {
+                'Sprint': sprint.get('Sprint', position),
+                'Features': '', 'DesignTime': '', 'ConstructionTime': '',
+                'TestCoverage': '', 'Feedback': ''
+            }
+            for key in ('Features', 'Feedback') + NUMERIC_SPRINT_FIELDS:
+                iteration_data[key] = _field_text(sprint.get(key))
+            project.add_iteration(SprintRecord.from_dict(iteration_data, strict=True))
+
+        project.final_deployment_date = record.get("final_deployment_date")
+        return project
+
+    @classmethod
+    def load(cls, source):
+        """Loads a project from a JSON file path or an open text stream."""
+        if isinstance(source, str):
+            with open(source) as stream:
+                return cls.from_records(json.load(stream))
+        return cls.from_records(json.load(source))
 
     def run_project_simulation(self):
         print("-" * 50)
@@ -58,38 +297,156 @@ class Khader:
         iteration_data['TestCoverage'] = input(f"[DEPLOYMENT] Test/UAT coverage score (in %): ")
         iteration_data['Feedback'] = input(f"[DEPLOYMENT] Key Stakeholder Feedback/Adjustments identified: ")
         
+        self.add_iteration(iteration_data)
+
+    def add_iteration(self, iteration_data):
+        # its report section is rendered the next time a report is requested
+        if not isinstance(iteration_data, SprintRecord):
+            iteration_data = SprintRecord.from_dict(iteration_data)
         self.iterations.append(iteration_data)
+        self.sprint_columns.append(iteration_data)
+
+    def update_iteration(self, position, **fields):
+        # edits one sprint and re-renders only that sprint's section
+        self.iterations[position].update(fields)
+        self.sprint_columns.set(position, self.iterations[position])
+        for sections in self._sprint_sections.values():
+            if position < len(sections):
+                sections[position] = None
+
+    def metrics(self):
+        estimate = _parse_number(self.planning_data.get('InitialEstimate', ''))
+        return compute_sprint_metrics(self.sprint_columns, estimate)
+
+    def _linear_fields(self):
+        return [
+            ("Overall Project Goal", self.communication_data.get('Goal', 'N/A')),
+            ("Key Stakeholders", self.communication_data.get('Stakeholders', 'N/A')),
+            ("Initial Estimate", self.planning_data.get('InitialEstimate', 'N/A')),
+            ("Architecture", self.planning_data.get('Architecture', 'N/A')),
+            ("Identified Risks", self.planning_data.get('KeyRisks', 'N/A')),
+        ]
+
+    @staticmethod
+    def _render_sprint(fmt, data):
+        if fmt == "json":
+            return json.dumps(data.as_dict())
+        if fmt == "markdown":
+            lines = [f"\n### Sprint {data['Sprint']}\n"]
+            for label, key in SPRINT_FIELDS:
+                lines.append(f"- **{label}:** {data[key]}\n")
+            return "".join(lines)
+        return (f"\n  > SPRINT {data['Sprint']}:\n"
+                f"    - Features Developed: {data['Features']}\n"
+                f"    - Modeling Time: {data['DesignTime']}\n"
+                f"    - Construction Time: {data['ConstructionTime']}\n"
+                f"    - Test Coverage: {data['TestCoverage']}\n"
+                f"    - **Feedback for Next Sprint:** {data['Feedback']}\n")
+
+    def _sprint_sections_for(self, fmt):
+        sections = self._sprint_sections[fmt]
+        del sections[len(self.iterations):]
+        for position, data in enumerate(self.iterations):
+            if position == len(sections):
+                sections.append(self._render_sprint(fmt, data))
+            elif sections[position] is None:
+                sections[position] = self._render_sprint(fmt, data)
+        return sections
+
+    def render_report(self, fmt="text"):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format '{fmt}'. Choose from: {', '.join(REPORT_FORMATS)}")
+        sections = self._sprint_sections_for(fmt)
+
+        if fmt == "json":
+            return "".join([
+                '{"project_name": ', json.dumps(self.project_name),
+                ', "communication": ', json.dumps(self.communication_data),
+                ', "planning": ', json.dumps(self.planning_data),
+                ', "iterations": [', ", ".join(sections), ']',
+                ', "final_deployment_date": ', json.dumps(self.final_deployment_date), '}\n',
+            ])
+
+        if fmt == "markdown":
+            parts = [f"# Khader Model Project Report: {self.project_name}\n",
+                     "\n## I. Linear Foundation (Communication & Planning)\n\n"]
+            parts.extend(f"- **{label}:** {value}\n" for label, value in self._linear_fields())
+            parts.append("\n## II. Iterative Development Cycles\n")
+            parts.extend(sections if sections else ["\nNo iterations were executed.\n"])
+            parts.append("\n## III. Final Rollout\n\n")
+            parts.append(f"- **Final Deployment Date:** {self.final_deployment_date}\n")
+            return "".join(parts)
+
+        rule = "=" * 70
+        parts = [f"\n{rule}\nKHADER MODEL PROJECT REPORT: {self.project_name.upper()}\n{rule}\n",
+                 "\n--- I. LINEAR FOUNDATION (COMMUNICATION & PLANNING) ---\n"]
+        parts.extend(f"  {label}: {value}\n" for label, value in self._linear_fields())
+        parts.append("\n--- II. ITERATIVE DEVELOPMENT CYCLES ---\n")
+        parts.extend(sections if sections else ["  No iterations were executed.\n"])
+        parts.append("\n--- III. FINAL ROLLOUT ---\n")
+        parts.append(f"  Final Deployment Date: {self.final_deployment_date}\n{rule}\n\n")
+        return "".join(parts)
+
+    def generate_report(self, fmt="text", stream=None):
+        # the whole report goes out in a single write
+        (stream or sys.stdout).write(self.render_report(fmt))
+
+
+def benchmark_memory(num_sprints=100_000):
+    """Compares the old dict-of-strings iterations with SprintRecord objects plus columns."""
+    def build_dicts():
+        return [{'Sprint': i, 'Features': 'Feature set', 'DesignTime': str(i % 4 + 1),
+                 'ConstructionTime': str(i % 3 + 2), 'TestCoverage': str(70 + i % 30),
+                 'Feedback': 'Keep going'} for i in range(1, num_sprints + 1)]
+
+    def build_records():
+        records = [SprintRecord(i, 'Feature set', float(i % 4 + 1), float(i % 3 + 2),
+                                float(70 + i % 30), 'Keep going') for i in range(1, num_sprints + 1)]
+        columns = SprintColumns()
+        for record in records:
+            columns.append(record)
+        return records, columns
+
+    print(f"Sprint storage for {num_sprints:,} sprints:")
+    for label, build in (("dict of strings", build_dicts), ("records+columns", build_records)):
+        tracemalloc.start()
+        sprints = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"  {label:<16} {used / num_sprints:7.1f} bytes/sprint")
+
+    _require_numpy()  # keep the import out of the timing
+    start = time.perf_counter()
+    metrics = compute_sprint_metrics(sprints[1], initial_estimate=num_sprints * 5.0)
+    elapsed = time.perf_counter() - start
+    print(f"  metrics pass:    {elapsed * 1000:7.1f} ms "
+          f"(trend {metrics.coverage_trend:+.4f}%/sprint, variance {metrics.estimate_variance_pct:+.1f}%)")
+
 
-    def generate_report(self):
-        print("\n" + "=" * 70)
-        print(f"KHADER MODEL PROJECT REPORT: {self.project_name.upper()}")
-        print("=" * 70)
-
-        print("\n--- I. LINEAR FOUNDATION (COMMUNICATION & PLANNING) ---")
-        print(f"  Overall Project Goal: {self.communication_data.get('Goal', 'N/A')}")
-        print(f"  Key Stakeholders: {self.communication_data.get('Stakeholders', 'N/A')}")
-        print(f"  Initial Estimate: {self.planning_data.get('InitialEstimate', 'N/A')}")
-        print(f"  Architecture: {self.planning_data.get('Architecture', 'N/A')}")
-        print(f"  Identified Risks: {self.planning_data.get('KeyRisks', 'N/A')}")
-
-        print("\n--- II. ITERATIVE DEVELOPMENT CYCLES ---")
-        if self.iterations:
-            for data in self.iterations:
-                print(f"\n  > SPRINT {data['Sprint']}:")
-                print(f"    - Features Developed: {data['Features']}")
-                print(f"    - Modeling Time: {data['DesignTime']}")
-                print(f"    - Construction Time: {data['ConstructionTime']}")
-                print(f"    - Test Coverage: {data['TestCoverage']}")
-                print(f"    - **Feedback for Next Sprint:** {data['Feedback']}")
-        else:
-            print("  No iterations were executed.")
-
-        print("\n--- III. FINAL ROLLOUT ---")
-        print(f"  Final Deployment Date: {self.final_deployment_date}")
-        print("=" * 70 + "\n")
+def print_metrics(project):
+    m = project.metrics()
+    print(f"Sprints: {m.sprints}")
+    print(f"Design time: {m.total_design_time:g} weeks total, {m.average_design_time:.2f} avg")
+    print(f"Construction time: {m.total_construction_time:g} weeks total, {m.average_construction_time:.2f} avg")
+    print(f"Test coverage: {m.average_coverage:.1f}% avg, trend {m.coverage_trend:+.3f}% per sprint")
+    print(f"Estimate variance: {m.estimate_variance:+g} weeks ({m.estimate_variance_pct:+.1f}%) "
+          f"against {m.initial_estimate:g} planned")
 
 
 if __name__ == "__main__":
-    project_name = input("Enter the project name: ")
-    khader_project = Khader(project_name=project_name)
-    khader_project.run_project_simulation()
+    if sys.argv[1:2] == ["--benchmark"]:
+        benchmark_memory(int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+    elif sys.argv[1:2] == ["--metrics"]:
+        print_metrics(Khader.load(sys.stdin if sys.argv[2] == "-" else sys.argv[2]))
+    elif sys.argv[1:2] == ["--import"]:
+        # args: --import <project JSON file or -> [text|markdown|json]
+        source = sys.stdin if sys.argv[2] == "-" else sys.argv[2]
+        try:
+            khader_project = Khader.load(source)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Import failed: {e}")
+        khader_project.generate_report(sys.argv[3] if len(sys.argv) > 3 else "text")
+    else:
+        project_name = input("Enter the project name: ")
+        khader_project = Khader(project_name=project_name)
+        khader_project.run_project_simulation()
@@ -1,3 +1,12 @@
+import csv
+import json
+import os
+import re
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque
+
 prototype_pages = {
     'P1': {'name': 'Home Page', 'flow': ['P2 (View Lists)', 'P3 (Create List)', 'P6 (Settings)']},
     'P2': {'name': 'Lists Directory', 'flow': ['P4 (Select List)', 'P1 (Go Back)']},
@@ -7,19 +16,555 @@ prototype_pages = {
     'P6': {'name': 'Settings', 'flow': ['P1 (Go Back)']}
 }
 
-total_pages = len(prototype_pages)
-print("--- Mobile App Prototype Documentation ---")
-print(f"Total number of prototype pages: {total_pages}\n")
+# 'P2 (View Lists)' -> ('P2', 'View Lists'); the action label is optional
+FLOW_PATTERN = re.compile(r"^\s*(\S+?)\s*(?:\((.*)\))?\s*$")
+
+
+def parse_flow(flow):
+    match = FLOW_PATTERN.match(flow)
+    if match is None:
+        raise ValueError(f"Malformed flow entry: {flow!r}")
+    return match.group(1), match.group(2) or ""
+
+
+class PageGraph:
+    """Navigation graph over prototype pages with integer node ids.
+
+    Edges are stored in compressed sparse rows (offsets/targets arrays), so
+    every query below is a linear-time traversal. Reachability from a page,
+    strongly connected components and dead ends are computed once and cached.
+    """
+
+    # BFS trees kept for repeated queries; each costs 8 bytes per page
+    BFS_CACHE_SIZE = 16
+
+    def __init__(self, pages, bfs_cache_size=BFS_CACHE_SIZE):
+        self.keys = list(pages)
+        self.ids = {key: node for node, key in enumerate(self.keys)}
+        self.names = [pages[key]['name'] for key in self.keys]
+        self.offsets = array('l', [0])
+        self.targets = array('l')
+        self.labels = []
+        self.dangling = []  # (page key, flow entry) pairs whose target is not a page
+        for key in self.keys:
+            for flow in pages[key]['flow']:
+                target, label = parse_flow(flow)
+                node = self.ids.get(target)
+                if node is None:
+                    self.dangling.append((key, flow))
+                    continue
+                self.targets.append(node)
+                self.labels.append(label)
+            self.offsets.append(len(self.targets))
+        self._parents = OrderedDict()  # source -> BFS tree, least recently used first
+        self.bfs_cache_size = bfs_cache_size
+        self._components = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def successors(self, node):
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def _bfs_parents(self, source):
+        # BFS tree from 'source' (parent id per node, -1 = unreached), LRU-cached per source
+        parents = self._parents.get(source)
+        if parents is not None:
+            self._parents.move_to_end(source)
+        else:
+            offsets, targets = self.offsets, self.targets
+            parents = array('l', [-1]) * len(self.keys)
+            parents[source] = source
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                for edge in range(offsets[node], offsets[node + 1]):
+                    target = targets[edge]
+                    if parents[target] == -1:
+                        parents[target] = node
+                        queue.append(target)
+            self._parents[source] = parents
+            if len(self._parents) > self.bfs_cache_size:
+                self._parents.popitem(last=False)
+        return parents
+
+    def shortest_path(self, start_key, end_key):
+        """Fewest-clicks path as a list of page keys, or None if unreachable."""
+        start, end = self.ids[start_key], self.ids[end_key]
+        parents = self._bfs_parents(start)
+        if parents[end] == -1:
+            return None
+        path = [end]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return [self.keys[node] for node in reversed(path)]
+
+    def unreachable_from(self, start_key='P1'):
+        parents = self._bfs_parents(self.ids[start_key])
+        return [key for key, parent in zip(self.keys, parents) if parent == -1]
+
+    def dead_ends(self):
+        offsets = self.offsets
+        return [key for node, key in enumerate(self.keys) if offsets[node] == offsets[node + 1]]
+
+    def strongly_connected_components(self):
+        """Iterative Tarjan; components are lists of page keys, cached after the first call."""
+        if self._components is None:
+            offsets, targets = self.offsets, self.targets
+            count = len(self.keys)
+            index = array('l', [-1]) * count
+            lowlink = array('l', [0]) * count
+            on_stack = bytearray(count)
+            stack = []
+            components = []
+            counter = 0
+            for root in range(count):
+                if index[root] != -1:
+                    continue
+                work = [(root, offsets[root])]
+                index[root] = lowlink[root] = counter
+                counter += 1
+                stack.append(root)
+                on_stack[root] = 1
+                while work:
+                    node, edge = work[-1]
+                    if edge < offsets[node + 1]:
+                        work[-1] = (node, edge + 1)
+                        target = targets[edge]
+                        if index[target] == -1:
+                            index[target] = lowlink[target] = counter
+                            counter += 1
+                            stack.append(target)
+                            on_stack[target] = 1
+                            work.append((target, offsets[target]))
+                        elif on_stack[target] and index[target] < lowlink[node]:
+                            lowlink[node] = index[target]
+                        continue
+                    work.pop()
+                    if work and lowlink[node] < lowlink[work[-1][0]]:
+                        lowlink[work[-1][0]] = lowlink[node]
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = 0
+                            component.append(self.keys[member])
+                            if member == node:
+                                break
+                        components.append(component)
+            self._components = components
+        return self._components
+
+
+class PageMapValidator:
+    """Incrementally maintained page index with flow-target validation.
+
+    A reverse index (target key -> pages whose flow points at it) means an
+    edit only re-checks the edited page and the pages that link to it,
+    instead of the whole map.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.targets = {}     # page key -> parsed target key of each flow entry
+        self.referrers = {}   # target key -> set of page keys linking to it
+        self.broken = {}      # page key -> list of flow entries with a missing target
+
+    def _check(self, key):
+        pages = self.pages
+        missing = [flow for flow, target in zip(pages[key]['flow'], self.targets[key])
+                   if target not in pages]
+        if missing:
+            self.broken[key] = missing
+        else:
+            self.broken.pop(key, None)
+
+    def set_page(self, key, name, flow):
+        """Adds or replaces a page. Returns the keys whose validation was re-run."""
+        flow = list(flow)
+        flow_targets = [parse_flow(entry)[0] for entry in flow]  # raises on malformed entries
+        targets = set(flow_targets)
+        is_new = key not in self.pages
+        if not is_new:
+            for old_target in set(self.targets[key]) - targets:
+                sources = self.referrers[old_target]
+                sources.discard(key)
+                if not sources:
+                    del self.referrers[old_target]
+        for target in targets:
+            self.referrers.setdefault(target, set()).add(key)
+        self.pages[key] = {'name': name, 'flow': flow}
+        self.targets[key] = flow_targets
+
+        affected = {key}
+        if is_new:
+            # pages that were pointing at this key are now valid
+            affected.update(self.referrers.get(key, ()))
+        for page_key in affected:
+            self._check(page_key)
+        return affected
+
+    def remove_page(self, key):
+        """Removes a page. Returns the keys whose validation was re-run."""
+        del self.pages[key]
+        self.broken.pop(key, None)
+        for target in set(self.targets.pop(key)):
+            sources = self.referrers[target]
+            sources.discard(key)
+            if not sources:
+                del self.referrers[target]
+        affected = set(self.referrers.get(key, ()))
+        for page_key in affected:
+            self._check(page_key)
+        return affected
+
+    def errors(self, keys=None):
+        """(page key, flow entry) pairs whose target page does not exist."""
+        keys = self.broken if keys is None else [key for key in keys if key in self.broken]
+        return [(key, flow) for key in keys for flow in self.broken[key]]
+
+    def graph(self):
+        return PageGraph(self.pages)
+
+
+def iter_page_definitions(path):
+    """Streams (key, name, flow, deleted) records from a page map file.
+
+    Formats, by extension:
+      .jsonl / .ndjson  one {"key", "name", "flow", optional "deleted"} object per line
+      .json             an object shaped like prototype_pages
+      .csv              key,name,flow columns with flow entries separated by ';'
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as source:
+        if extension in ('.jsonl', '.ndjson'):
+            for line_number, line in enumerate(source, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise _invalid_record(path, line_number, e) from None
+                if not isinstance(record, dict):
+                    raise _invalid_record(path, line_number, f"expected a JSON object, got {type(record).__name__}")
+                if 'key' not in record:
+                    raise _invalid_record(path, line_number, "missing field 'key'")
+                yield record['key'], record.get('name', ''), record.get('flow', []), record.get('deleted', False)
+        elif extension == '.json':
+            try:
+                pages = json.load(source)
+            except json.JSONDecodeError as e:
+                raise _invalid_record(path, e.lineno, e.msg) from None
+            if not isinstance(pages, dict):
+                raise _invalid_record(path, 1, "the page map must be a JSON object")
+            for key, data in pages.items():
+                # json.load keeps no positions; the page key locates the record
+                if not isinstance(data, dict):
+                    raise _invalid_record(path, key, f"expected a JSON object, got {type(data).__name__}")
+                for field in ('name', 'flow'):
+                    if field not in data:
+                        raise _invalid_record(path, key, f"missing field '{field}'")
+                yield key, data['name'], data['flow'], False
+        elif extension == '.csv':
+            rows = csv.DictReader(source)
+            for row in rows:
+                for field in ('key', 'name'):
+                    if field not in row:
+                        raise _invalid_record(path, rows.line_num, f"missing column '{field}'")
+                flow = [entry.strip() for entry in (row.get('flow') or '').split(';') if entry.strip()]
+                yield row['key'], row['name'], flow, False
+        else:
+            raise ValueError(f"Unsupported page map format: {path}")
+
+
+def _invalid_record(path, where, error):
+    # every format reports problems as ValueError("<path>:<line or key>: ...")
+    return ValueError(f"{path}:{where}: invalid page record ({error})")
+
+
+def load_pages(paths, validator=None, report=None):
+    """Applies page map files in order, re-validating only the pages each record touches.
+
+    'report' is called with (key, errors for the affected pages) after every record.
+    """
+    validator = validator if validator is not None else PageMapValidator()
+    for path in paths:
+        for key, name, flow, deleted in iter_page_definitions(path):
+            if deleted:
+                affected = validator.remove_page(key) if key in validator.pages else set()
+            else:
+                affected = validator.set_page(key, name, flow)
+            if report is not None:
+                report(key, validator.errors(affected))
+    return validator
+
+
+def _require_numpy():
+    # NumPy is only needed for journey analytics; the rest of the module runs without it
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Journey analytics need NumPy (pip install numpy)") from None
+    return numpy
+
+
+class JourneyModel:
+    """Markov chain over the prototype flow for traffic estimates.
+
+    Users follow each flow entry of a page with equal probability and a dead
+    end sends them back to the start page. The transition matrix is kept as
+    the graph's CSR edge arrays, so every step is a sparse matrix-vector
+    product done with NumPy bincount.
+    """
+
+    def __init__(self, graph, start_key='P1'):
+        np = _require_numpy()
+        self.np = np
+        self.graph = graph
+        self.start = graph.ids[start_key]
+        self.size = len(graph)
+        self.offsets = np.asarray(graph.offsets, dtype=np.int64)
+        self.targets = np.asarray(graph.targets, dtype=np.int64)
+        self.degree = np.diff(self.offsets)
+        self.sources = np.repeat(np.arange(self.size), self.degree)
+        self.probs = 1.0 / self.degree[self.sources]
+        self.dead = self.degree == 0
+
+    def step(self, dist):
+        """One transition of a probability (or count) vector over pages."""
+        np = self.np
+        moved = np.bincount(self.targets, weights=dist[self.sources] * self.probs, minlength=self.size)
+        moved[self.start] += dist[self.dead].sum()
+        return moved
+
+    def expected_next(self, values):
+        """(P @ values): the expected value after one step from every page."""
+        np = self.np
+        result = np.bincount(self.sources, weights=self.probs * values[self.targets], minlength=self.size)
+        result[self.dead] = values[self.start]
+        return result
+
+    def stationary(self, tol=1e-12, max_iter=100_000):
+        """Long-run share of visits per page (power iteration on the lazy chain)."""
+        np = self.np
+        dist = np.full(self.size, 1.0 / self.size)
+        for _ in range(max_iter):
+            # the lazy chain (half stay, half move) has the same stationary
+            # distribution but also converges on periodic flows like P1 <-> P6
+            updated = 0.5 * dist + 0.5 * self.step(dist)
+            if np.abs(updated - dist).sum() < tol:
+                return updated
+            dist = updated
+        return dist
+
+    def expected_steps(self, target_key, tol=1e-9, max_iter=100_000):
+        """Expected clicks from every page until 'target_key' is first reached (inf if never).
+
+        The expectation is finite only where the target is reached with
+        probability 1: a page that can wander, without passing the target, to
+        a page that never reaches it gets inf as well.
+        """
+        np = self.np
+        target = self.graph.ids[target_key]
+        seeds = np.zeros(self.size, dtype=bool)
+        seeds[target] = True
+        reaches = self._reverse_reach(seeds)
+        lost = self._reverse_reach(~reaches, blocked=target)
+        steps = np.zeros(self.size)
+        for _ in range(max_iter):
+            updated = 1.0 + self.expected_next(steps)
+            updated[target] = 0.0
+            updated[lost] = 0.0
+            if np.abs(updated - steps).max() < tol:
+                steps = updated
+                break
+            steps = updated
+        steps[lost] = np.inf
+        return steps
+
+    def _reverse_reach(self, seeds, blocked=None):
+        # pages with a path into 'seeds' (a bool mask) that avoids 'blocked';
+        # reverse BFS over the edge arrays (dead ends lead to the start page)
+        np = self.np
+        reached = seeds.copy()
+        frontier = np.flatnonzero(reached)
+        while frontier.size:
+            marked = np.zeros(self.size, dtype=bool)
+            marked[frontier] = True
+            into = marked[self.targets]
+            candidates = self.sources[into]
+            if marked[self.start]:
+                candidates = np.concatenate([candidates, np.flatnonzero(self.dead)])
+            candidates = np.unique(candidates)
+            frontier = candidates[~reached[candidates]]
+            if blocked is not None:
+                frontier = frontier[frontier != blocked]
+            reached[frontier] = True
+        return reached
+
+    def top_transitions(self, count=10, stationary=None):
+        """Edges carrying the most long-run traffic: (source key, target key, share)."""
+        np = self.np
+        if stationary is None:
+            stationary = self.stationary()
+        flow = stationary[self.sources] * self.probs
+        count = min(count, flow.size)
+        if count == 0:
+            return []
+        top = np.argpartition(-flow, count - 1)[:count]
+        top = top[np.argsort(-flow[top])]
+        keys = self.graph.keys
+        return [(keys[self.sources[edge]], keys[self.targets[edge]], float(flow[edge])) for edge in top]
+
+    def simulate(self, journeys=1_000_000, steps=50, target_key='P4', seed=505):
+        """Random walks from the start page, all journeys advanced together each step.
+
+        Returns (visit share per page, mean clicks to first reach 'target_key'
+        over the journeys that reached it, fraction of journeys that did).
+        """
+        np = self.np
+        rng = np.random.default_rng(seed)
+        target = self.graph.ids[target_key]
+        position = np.full(journeys, self.start, dtype=np.int64)
+        visits = np.bincount(position, minlength=self.size).astype(np.float64)
+        first_hit = np.full(journeys, -1, dtype=np.int64)
+        # with no links at all every page is a dead end, so every click restarts
+        has_edges = self.targets.size > 0
+        for step in range(1, steps + 1):
+            if not has_edges:
+                position = np.full(journeys, self.start, dtype=np.int64)
+            else:
+                degree = self.degree[position]
+                choice = (rng.random(journeys) * degree).astype(np.int64)
+                moving = degree > 0
+                position = np.where(moving, self.targets[np.minimum(self.offsets[position] + choice, self.targets.size - 1)], self.start)
+            visits += np.bincount(position, minlength=self.size)
+            hit = (first_hit < 0) & (position == target)
+            first_hit[hit] = step
+        reached = first_hit > 0
+        mean_steps = float(first_hit[reached].mean()) if reached.any() else float('inf')
+        return visits / visits.sum(), mean_steps, float(reached.mean())
+
+
+def print_journey_report(pages, start_key='P1', target_key='P4', journeys=1_000_000):
+    model = JourneyModel(PageGraph(pages), start_key)
+    stationary = model.stationary()
+    steps = model.expected_steps(target_key)
+    start = time.perf_counter()
+    visits, mean_steps, reached = model.simulate(journeys, target_key=target_key)
+    elapsed = time.perf_counter() - start
+
+    print("\n--- User Journey Analytics ---")
+    print("[Stationary Visit Share]")
+    for node in stationary.argsort()[::-1][:10]:
+        key = model.graph.keys[node]
+        print(f"  {key} ({pages[key]['name']}): {stationary[node]:.1%}  (simulated {visits[node]:.1%})")
+    print(f"[Expected Clicks {start_key} -> {target_key}]")
+    print(f"  Markov chain: {steps[model.start]:.2f}")
+    print(f"  Simulated ({journeys:,} journeys in {elapsed:.2f}s): {mean_steps:.2f} ({reached:.1%} reached)")
+    print("[Top Transitions by Flow]")
+    for source, target, share in model.top_transitions(5, stationary):
+        print(f"  {source} -> {target}: {share:.1%}")
+    print("----------------------------------------")
+
+
+def print_documentation():
+    total_pages = len(prototype_pages)
+    print("--- Mobile App Prototype Documentation ---")
+    print(f"Total number of prototype pages: {total_pages}\n")
+
+    print("--- Page Names and Sequence/Flow ---")
+
+    print("\n[Page Names]")
+    for page_key, data in prototype_pages.items():
+        print(f"  - {page_key}: {data['name']}")
+
+    print("\n[Page Flow Sequence]")
+    for page_key, data in prototype_pages.items():
+        flow_targets = " -> ".join(data['flow'])
+        print(f"{page_key} ({data['name']}) -> Primary Transitions: {flow_targets}")
+
+    print("\n----------------------------------------")
+
+
+def print_analysis(pages, start_key='P1'):
+    graph = PageGraph(pages)
+    print("\n--- Prototype Flow Analysis ---")
+    for key in graph.keys:
+        path = graph.shortest_path(start_key, key)
+        print(f"  Shortest path {start_key} -> {key}: {' -> '.join(path) if path else 'unreachable'}")
+    print(f"  Unreachable from {start_key}: {', '.join(graph.unreachable_from(start_key)) or 'none'}")
+    print(f"  Dead ends: {', '.join(graph.dead_ends()) or 'none'}")
+    print(f"  Broken flow targets: {', '.join(f'{key} -> {flow}' for key, flow in graph.dangling) or 'none'}")
+    components = graph.strongly_connected_components()
+    print(f"  Strongly connected components: {' | '.join(', '.join(sorted(c)) for c in components)}")
+    print("----------------------------------------")
+
+
+def generate_pages(count, fanout=3, seed=505):
+    # synthetic app map for benchmarks: random flows plus a spine so most pages are reachable
+    import random
+    rng = random.Random(seed)
+    pages = {}
+    for i in range(1, count + 1):
+        flow = [f"P{rng.randint(1, count)} (Link {j})" for j in range(fanout - 1)]
+        if i < count:
+            flow.append(f"P{i + 1} (Next)")
+        pages[f"P{i}"] = {'name': f"Screen {i}", 'flow': flow}
+    return pages
+
+
+def benchmark_graph(count=100_000):
+    pages = generate_pages(count)
+    timings = []
+    start = time.perf_counter()
+    graph = PageGraph(pages)
+    timings.append(("build", time.perf_counter() - start))
+    start = time.perf_counter()
+    graph.shortest_path('P1', f"P{count}")
+    timings.append(("shortest path (cold)", time.perf_counter() - start))
+    start = time.perf_counter()
+    graph.shortest_path('P1', f"P{count // 2}")
+    timings.append(("shortest path (cached)", time.perf_counter() - start))
+    start = time.perf_counter()
+    graph.unreachable_from('P1')
+    timings.append(("unreachable", time.perf_counter() - start))
+    start = time.perf_counter()
+    graph.dead_ends()
+    timings.append(("dead ends", time.perf_counter() - start))
+    start = time.perf_counter()
+    components = graph.strongly_connected_components()
+    timings.append(("strongly connected components", time.perf_counter() - start))
+
+    print(f"--- Graph Benchmark ({count:,} pages, {len(graph.targets):,} edges, {len(components):,} SCCs) ---")
+    for label, seconds in timings:
+        print(f"  {label:<30} {seconds * 1000:10.2f} ms")
 
-print("--- Page Names and Sequence/Flow ---")
 
-print("\n[Page Names]")
-for page_key, data in prototype_pages.items():
-    print(f"  - {page_key}: {data['name']}")
+def print_load_summary(paths):
+    start = time.perf_counter()
+    validator = load_pages(paths)
+    elapsed = time.perf_counter() - start
+    errors = validator.errors()
+    print(f"Loaded {len(validator.pages):,} pages from {len(paths)} file(s) in {elapsed * 1000:.1f} ms")
+    print(f"Broken flow targets: {len(errors):,}")
+    for key, flow in errors[:20]:
+        print(f"  - {key}: {flow}")
+    if len(errors) > 20:
+        print(f"  ... {len(errors) - 20:,} more")
+    return validator
 
-print("\n[Page Flow Sequence]")
-for page_key, data in prototype_pages.items():
-    flow_targets = " -> ".join(data['flow'])
-    print(f"{page_key} ({data['name']}) -> Primary Transitions: {flow_targets}")
 
-print("\n----------------------------------------")
\ No newline at end of file
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--benchmark"]:
+        benchmark_graph()
+    elif sys.argv[1:2] == ["--journeys"]:
+        # args: --journeys [number of simulated journeys]
+        print_journey_report(prototype_pages, journeys=int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    elif sys.argv[1:2] == ["--load"]:
+        # args: --load <map file> [edit files applied on top, in order]
+        print_load_summary(sys.argv[2:])
+    else:
+        print_documentation()
+        if sys.argv[1:2] == ["--analyze"]:
+            print_analysis(prototype_pages)
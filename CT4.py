@@ -1,18 +1,66 @@
 import abc
+import copy
+import cProfile
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+# How SoftwareProject announces itself: print (the original behaviour), log at INFO, or stay quiet
+ANNOUNCE_MODES = ("print", "log", "quiet")
 
 # Product: SoftwareProject (The object being built)
 class SoftwareProject:
     """Represents the final software project product."""
-    def __init__(self, project_name: str):
+    __slots__ = ("project_name", "steps", "step_times", "cached_steps")
+
+    def __init__(self, project_name: str, announce: str = "print"):
         self.project_name = project_name
         self.steps = []
-        print(f"- Initiating Project: {self.project_name} -")
+        # per-step wall time in seconds, created on first use by ParallelProjectDirector
+        self.step_times = None
+        self.cached_steps = None
+        if announce == "print":
+            print(f"- Initiating Project: {self.project_name} -")
+        elif announce == "log":
+            logger.info("Initiating Project: %s", self.project_name)
+        elif announce != "quiet":
+            raise ValueError(f"announce must be one of: {', '.join(ANNOUNCE_MODES)}")
 
     def add_step(self, part: str):
         """Adds a construction step to the project."""
+        if type(self.steps) is tuple:
+            self.steps = list(self.steps)
         self.steps.append(part)
 
+    def record_step_time(self, name: str, seconds: float, cached: bool = False):
+        """Records how long a build step took (0.0 for steps reused from a cache)."""
+        if self.step_times is None:
+            self.step_times = {}
+            self.cached_steps = set()
+        self.step_times[name] = seconds
+        if cached:
+            self.cached_steps.add(name)
+
+    def freeze(self, shared: dict):
+        """
+        Swaps the step list for an interned tuple shared with every other
+        product built with the same steps. add_step() still works afterwards.
+        """
+        steps = tuple(sys.intern(part) for part in self.steps)
+        self.steps = shared.setdefault(steps, steps)
+
     def display(self):
         """Prints the completed construction process and links to the traits."""
         print("\n- Project Construction Complete -")
@@ -20,6 +68,11 @@ class SoftwareProject:
         print("Completed Steps (Detail-Oriented Sequence):")
         for i, step in enumerate(self.steps, 1):
             print(f"  {i}. {step}")
+        if self.step_times:
+            print("\n- Step Timings -")
+            for name, seconds in self.step_times.items():
+                note = " (cached)" if name in self.cached_steps else ""
+                print(f"  {name}: {seconds * 1000:.3f} ms{note}")
         print("\n- Developer Traits Reflected in Design -")
         print(
             "1. Attention to Detail:** The Director enforced a strict, methodical build sequence.\n"
@@ -53,13 +106,19 @@ class AbstractProjectBuilder(ABC):
     def get_result(self) -> SoftwareProject:
         pass
 
+    # Builders may also define reset(name, announce) to start a fresh product;
+    # ProjectDirector.construct_many then reuses one instance for every project.
+
 
 # Concrete Builder: DetailOrientedBuilder (The Worker)
 class DetailOrientedBuilder(AbstractProjectBuilder):
     """A concrete builder focusing on meticulous, high-quality development steps."""
-    def __init__(self, name: str):
+    def __init__(self, name: str, announce: str = "print"):
         # Composition: The builder creates and holds the product instance
-        self.project = SoftwareProject(name)
+        self.project = SoftwareProject(name, announce)
+
+    def reset(self, name: str, announce: str = "print"):
+        self.project = SoftwareProject(name, announce)
 
     def build_requirements(self):
         self.project.add_step("Requirements: Conducted in-depth analysis and drafted comprehensive documentation (Trait: Attention to Detail).")
@@ -79,10 +138,137 @@ class DetailOrientedBuilder(AbstractProjectBuilder):
         return self.project
 
 
+# held while a step is profiled or memory-traced (see BuildInstrumentation.measure)
+_MEASURE_LOCK = threading.Lock()
+
+
+class StepStats:
+    """Accumulated measurements for one build step across every build."""
+    __slots__ = ("calls", "total_ns", "max_ns", "peak_memory", "profile")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.peak_memory = 0
+        self.profile = None
+
+
+class BuildInstrumentation:
+    """
+    Per-step timers for director-driven builds, with optional cProfile and
+    tracemalloc capture. Timings are also recorded on the product, so
+    SoftwareProject.display() shows them. A director without instrumentation
+    runs the plain build sequence and pays nothing.
+    """
+
+    def __init__(self, profile: bool = False, trace_memory: bool = False):
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.steps = {}
+
+    def measure(self, method, measurement: dict = None) -> dict:
+        """
+        Runs method() and returns a dict with elapsed_ns, peak_memory and
+        profile (raw cProfile stats, or None). It is plain data, so it can be
+        returned from a worker process. A given dict is filled in even if
+        method() raises.
+        """
+        if measurement is None:
+            measurement = {}
+        measurement.update(elapsed_ns=0, peak_memory=0, profile=None)
+        exclusive = self.profile or self.trace_memory
+        if exclusive:
+            # one profiler and one tracemalloc peak per process: measured steps take turns
+            _MEASURE_LOCK.acquire()
+        profiler = cProfile.Profile() if self.profile else None
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter_ns()
+        if profiler:
+            profiler.enable()
+        try:
+            method()
+        finally:
+            if profiler:
+                profiler.disable()
+            measurement["elapsed_ns"] = time.perf_counter_ns() - start
+            if self.trace_memory:
+                measurement["peak_memory"] = tracemalloc.get_traced_memory()[1] - baseline
+                if started_tracing:
+                    tracemalloc.stop()
+            if profiler:
+                profiler.create_stats()
+                measurement["profile"] = profiler.stats
+            if exclusive:
+                _MEASURE_LOCK.release()
+        return measurement
+
+    def record(self, project: SoftwareProject, name: str, elapsed_ns: int,
+               peak_memory: int = 0, profile: dict = None):
+        """Adds one measured run of step 'name' to the totals and to the product's timings."""
+        stats = self.steps.get(name)
+        if stats is None:
+            stats = self.steps[name] = StepStats()
+        stats.calls += 1
+        stats.total_ns += elapsed_ns
+        stats.max_ns = max(stats.max_ns, elapsed_ns)
+        stats.peak_memory = max(stats.peak_memory, peak_memory)
+        if profile is not None:
+            loaded = pstats.Stats()
+            loaded.stats = profile
+            loaded.get_top_level_stats()
+            if stats.profile is None:
+                stats.profile = loaded
+            else:
+                stats.profile.add(loaded)
+        project.record_step_time(name, elapsed_ns / 1e9)
+
+    def run_step(self, builder: AbstractProjectBuilder, name: str, method):
+        measurement = {}
+        try:
+            self.measure(method, measurement)
+        finally:
+            self.record(builder.get_result(), name, **measurement)
+
+    def summary(self, top: int = 5) -> dict:
+        """Per-step totals; with profiling, the top functions by cumulative time."""
+        summary = {}
+        for name, stats in self.steps.items():
+            entry = {
+                "calls": stats.calls,
+                "total_ms": stats.total_ns / 1e6,
+                "mean_ms": stats.total_ns / stats.calls / 1e6,
+                "max_ms": stats.max_ns / 1e6,
+            }
+            if self.trace_memory:
+                entry["peak_memory_bytes"] = stats.peak_memory
+            if stats.profile is not None:
+                rows = sorted(stats.profile.stats.items(), key=lambda item: item[1][3], reverse=True)
+                entry["top_functions"] = [
+                    {"function": f"{filename}:{line}({function})", "calls": calls, "cumulative_ms": cumulative * 1000}
+                    for (filename, line, function), (_, calls, _, cumulative, _) in rows[:top]
+                ]
+            summary[name] = entry
+        return summary
+
+    def to_json(self, top: int = 5) -> str:
+        return json.dumps({"steps": self.summary(top)}, indent=2)
+
+
 # Director: ProjectDirector (The Enforcer)
 class ProjectDirector:
     """The Director enforces the correct, methodical sequence of the build process."""
 
+    def __init__(self, instrumentation: BuildInstrumentation = None):
+        self.instrumentation = instrumentation
+
     def construct(self, builder: AbstractProjectBuilder):
         """
         Enforces the standard, detail-oriented construction sequence.
@@ -90,14 +276,402 @@ class ProjectDirector:
         """
         # Implements the + construct(builder : AbstractProjectBuilder) method.
         # Enforces the "Attention to Detail" trait.
-        builder.build_requirements()
-        builder.build_design()
-        builder.build_implementation()
-        builder.build_testing()
+        if self.instrumentation is None:
+            builder.build_requirements()
+            builder.build_design()
+            builder.build_implementation()
+            builder.build_testing()
+            return
+        run_step = self.instrumentation.run_step
+        run_step(builder, "requirements", builder.build_requirements)
+        run_step(builder, "design", builder.build_design)
+        run_step(builder, "implementation", builder.build_implementation)
+        run_step(builder, "testing", builder.build_testing)
+
+    def construct_many(self, builder_factory, names, announce: str = "quiet"):
+        """
+        Builds one product per name and returns them in order.
+        builder_factory(name, announce) makes a builder (a builder class such as
+        DetailOrientedBuilder works). If the builder has a reset() method, that
+        one instance is pooled and reused for every product. Products with identical
+        steps share one tuple of interned step strings.
+        """
+        products = []
+        shared = {}
+        builder = None
+        for name in names:
+            if builder is not None and callable(getattr(builder, "reset", None)):
+                builder.reset(name, announce)
+            else:
+                builder = builder_factory(name, announce)
+            self.construct(builder)
+            project = builder.get_result()
+            project.freeze(shared)
+            products.append(project)
+        return products
+
+
+# A build step: the builder method to call and the step names it waits for.
+BuildStep = namedtuple("BuildStep", ["name", "method", "depends_on"])
+
+# The standard sequence expressed as a dependency chain.
+STANDARD_PIPELINE = (
+    BuildStep("requirements", "build_requirements", ()),
+    BuildStep("design", "build_design", ("requirements",)),
+    BuildStep("implementation", "build_implementation", ("design",)),
+    BuildStep("testing", "build_testing", ("implementation",)),
+)
+
+
+def _run_step(builder, method, profile=False, trace_memory=False):
+    """
+    Runs one builder method and returns the parts it added to the product
+    with its BuildInstrumentation measurement (profiled or memory-traced on request).
+    """
+    steps = builder.get_result().steps
+    before = len(steps)
+    measurement = BuildInstrumentation(profile, trace_memory).measure(getattr(builder, method))
+    return builder.get_result().steps[before:], measurement
+
+
+class BuildCache:
+    """
+    Step outputs keyed by a content hash of the builder's code (the source
+    of every class in its MRO and of the product class), its instance state,
+    the step, the project name and the outputs of its dependencies. Editing
+    a helper a step calls, or a class constant it reads, therefore misses the
+    cache. With a path the cache is kept on disk as JSON so unchanged steps
+    are reused between runs.
+    """
+
+    _class_digests = {}
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    @classmethod
+    def _class_digest(cls, klass):
+        # source of the class and its bases; builtins such as object have none
+        digest = cls._class_digests.get(klass)
+        if digest is None:
+            sha = hashlib.sha256()
+            for base in klass.__mro__:
+                try:
+                    source = inspect.getsource(base)
+                except (OSError, TypeError):
+                    source = base.__qualname__
+                sha.update(source.encode())
+                sha.update(b"\0")
+            digest = cls._class_digests[klass] = sha.hexdigest()
+        return digest
+
+    @classmethod
+    def key(cls, builder, step, dependency_parts):
+        project = builder.get_result()
+        state = sorted((name, repr(value)) for name, value in vars(builder).items()
+                       if value is not project)
+        digest = hashlib.sha256()
+        for part in (cls._class_digest(type(builder)), cls._class_digest(type(project)),
+                     repr(state), step.name, step.method, project.project_name):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        for parts in dependency_parts:
+            digest.update(json.dumps(parts).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, parts):
+        self.entries[key] = parts
+
+    def save(self):
+        if self.path:
+            with open(self.path, "w") as f:
+                json.dump(self.entries, f)
+
+
+class ParallelProjectDirector(ProjectDirector):
+    """
+    Runs declared build steps as a DAG: a step starts as soon as the steps
+    it depends on are done, so independent steps run concurrently on a
+    thread or process pool. Each step runs against its own copy of the
+    builder; the parts it adds are applied to the real product in declared
+    order, so the result does not depend on scheduling. With instrumentation,
+    every step is measured where it runs and merged into it afterwards;
+    profiled or memory-traced steps take turns within a process.
+    """
+
+    def __init__(self, steps=STANDARD_PIPELINE, executor="thread", max_workers=None, cache=None,
+                 instrumentation: BuildInstrumentation = None):
+        # Each step runs against its own copy of the builder, with every part
+        # its (transitive) dependencies added applied first in declared order,
+        # so it sees the same product the sequential director would show it.
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'")
+        super().__init__(instrumentation)
+        self.steps = list(steps)
+        self.executor = executor
+        self.max_workers = max_workers
+        self.cache = cache
+        self._check_graph()
+        self._ancestors = self._ancestor_lists()
+
+    def _check_graph(self):
+        names = {step.name for step in self.steps}
+        if len(names) != len(self.steps):
+            raise ValueError("Duplicate build step names")
+        for step in self.steps:
+            for dependency in step.depends_on:
+                if dependency not in names:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+        # Kahn's algorithm; anything left over sits on a cycle
+        remaining = {step.name: set(step.depends_on) for step in self.steps}
+        ready = [name for name, deps in remaining.items() if not deps]
+        while ready:
+            done = ready.pop()
+            del remaining[done]
+            for name, deps in remaining.items():
+                if done in deps:
+                    deps.discard(done)
+                    if not deps:
+                        ready.append(name)
+        if remaining:
+            raise ValueError(f"Build steps form a cycle: {', '.join(sorted(remaining))}")
+
+    def _ancestor_lists(self):
+        # step name -> every step it depends on directly or indirectly, in declared order
+        closure = {}
+        for step in self.steps:
+            closure[step.name] = set(step.depends_on)
+        changed = True
+        while changed:
+            changed = False
+            for name, ancestors in closure.items():
+                grown = ancestors.union(*(closure[dep] for dep in ancestors))
+                if grown != ancestors:
+                    closure[name] = grown
+                    changed = True
+        return {step.name: [other.name for other in self.steps if other.name in closure[step.name]]
+                for step in self.steps}
+
+    def _builder_for(self, builder, step, outputs):
+        # a copy of the builder whose product already holds its dependencies' parts
+        step_builder = copy.deepcopy(builder)
+        step_project = step_builder.get_result()
+        for ancestor in self._ancestors[step.name]:
+            for part in outputs[ancestor]:
+                step_project.add_step(part)
+        return step_builder
+
+    def construct(self, builder: AbstractProjectBuilder):
+        project = builder.get_result()
+        by_name = {step.name: step for step in self.steps}
+        waiting = {step.name: set(step.depends_on) for step in self.steps}
+        outputs = {}
+        running = {}
+        pool_type = ThreadPoolExecutor if self.executor == "thread" else ProcessPoolExecutor
+        instrumentation = self.instrumentation
+        measure_flags = ((instrumentation.profile, instrumentation.trace_memory)
+                         if instrumentation is not None else (False, False))
+
+        with pool_type(max_workers=self.max_workers) as pool:
+            while waiting or running:
+                for name in [name for name, deps in waiting.items() if not deps]:
+                    del waiting[name]
+                    step = by_name[name]
+                    key = None
+                    if self.cache is not None:
+                        key = BuildCache.key(builder, step, [outputs[d] for d in self._ancestors[name]])
+                        parts = self.cache.get(key)
+                        if parts is not None:
+                            outputs[name] = parts
+                            project.record_step_time(name, 0.0, cached=True)
+                            self._release(waiting, name)
+                            continue
+                    future = pool.submit(_run_step, self._builder_for(builder, step, outputs), step.method,
+                                         *measure_flags)
+                    running[future] = (name, key)
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name, key = running.pop(future)
+                    parts, measurement = future.result()
+                    outputs[name] = parts
+                    if instrumentation is not None:
+                        instrumentation.record(project, name, **measurement)
+                    else:
+                        project.record_step_time(name, measurement["elapsed_ns"] / 1e9)
+                    if key is not None:
+                        self.cache.put(key, parts)
+                    self._release(waiting, name)
+
+        for step in self.steps:
+            for part in outputs[step.name]:
+                project.add_step(part)
+            # list timings in declared order rather than completion order
+            project.step_times[step.name] = project.step_times.pop(step.name)
+        if self.cache is not None:
+            self.cache.save()
+
+    @staticmethod
+    def _release(waiting, done):
+        for deps in waiting.values():
+            deps.discard(done)
+
+
+class ModularPipelineBuilder(DetailOrientedBuilder):
+    """Demo builder for a real pipeline: per-module tests and docs next to the code."""
+    WORK_SECONDS = 0.2
+
+    def _work(self, part):
+        time.sleep(self.WORK_SECONDS)
+        self.project.add_step(part)
+
+    def build_implementation(self):
+        self._work("Implementation: Wrote clean, well-commented code, adhering strictly to style guides.")
+
+    def build_docs(self):
+        self._work("Documentation: Generated API reference alongside the implementation.")
+
+    def build_roster_tests(self):
+        self._work("Testing: Roster module unit tests.")
+
+    def build_scoring_tests(self):
+        self._work("Testing: Scoring module unit tests.")
+
+    def build_testing(self):
+        self.project.add_step("Testing: Integration and Regression suite over all modules.")
+
+
+MODULAR_PIPELINE = (
+    BuildStep("requirements", "build_requirements", ()),
+    BuildStep("design", "build_design", ("requirements",)),
+    BuildStep("implementation", "build_implementation", ("design",)),
+    BuildStep("docs", "build_docs", ("design",)),
+    BuildStep("roster_tests", "build_roster_tests", ("implementation",)),
+    BuildStep("scoring_tests", "build_scoring_tests", ("implementation",)),
+    BuildStep("testing", "build_testing", ("roster_tests", "scoring_tests")),
+)
+
+
+class StepCountingBuilder(DetailOrientedBuilder):
+    """Builder whose every step depends on what earlier steps produced."""
+
+    def _count(self, phase):
+        self.project.add_step(f"{phase}: built on {len(self.project.steps)} earlier steps.")
+
+    def build_requirements(self):
+        self._count("Requirements")
+
+    def build_design(self):
+        self._count("Design")
+
+    def build_implementation(self):
+        self._count("Implementation")
+
+    def build_testing(self):
+        self._count("Testing")
+
+
+def check_director_equivalence(executor="thread"):
+    """
+    Builds STANDARD_PIPELINE products with ProjectDirector and with
+    ParallelProjectDirector (with and without a cache) and raises
+    AssertionError if the products differ.
+    """
+    cache = BuildCache()
+    for builder_class in (DetailOrientedBuilder, StepCountingBuilder):
+        expected = builder_class("Check", announce="quiet")
+        ProjectDirector().construct(expected)
+        for _ in range(2):  # second pass is served from the cache
+            actual = builder_class("Check", announce="quiet")
+            ParallelProjectDirector(STANDARD_PIPELINE, executor=executor, cache=cache).construct(actual)
+            assert list(actual.get_result().steps) == list(expected.get_result().steps), (
+                f"{builder_class.__name__}: parallel build differs from sequential build")
+
+
+def run_parallel_demo(executor="thread", cache_path=None):
+    """Builds the modular pipeline twice; the second run reuses cached steps."""
+    check_director_equivalence(executor)
+    cache = BuildCache(cache_path)
+    for run in (1, 2):
+        builder = ModularPipelineBuilder("Fantasy Football Automatic Manager")
+        director = ParallelProjectDirector(MODULAR_PIPELINE, executor=executor, cache=cache)
+        start = time.perf_counter()
+        director.construct(builder)
+        print(f"Run {run}: built in {time.perf_counter() - start:.2f}s with a {executor} pool")
+        builder.get_result().display()
+        print()
+
+
+def benchmark_batch(num_products=100_000):
+    """Memory and time for num_products products, one builder each vs construct_many."""
+    names = [f"Project {i}" for i in range(num_products)]
+    director = ProjectDirector()
+
+    def one_builder_each():
+        products = []
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                for name in names:
+                    builder = DetailOrientedBuilder(name)
+                    director.construct(builder)
+                    products.append(builder.get_result())
+            finally:
+                sys.stdout = stdout
+        return products
+
+    def batch():
+        return director.construct_many(DetailOrientedBuilder, names)
+
+    scale = 100_000 / num_products
+    print(f"Building {num_products:,} products (figures per 100k):")
+    for label, build in (("one builder each, printing", one_builder_each),
+                         ("construct_many, quiet", batch)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        products = build()
+        elapsed = time.perf_counter() - start
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del products
+        print(f"  {label:<28} {elapsed * scale:6.2f} s  {used * scale / 2**20:7.1f} MiB")
+
+
+def run_instrumented_demo(options):
+    """Builds the demo project with instrumentation; options: profile, memory, json, parallel."""
+    instrumentation = BuildInstrumentation(profile="profile" in options, trace_memory="memory" in options)
+    announce = "quiet" if "json" in options else "print"
+    if "parallel" in options:
+        builder = ModularPipelineBuilder("Fantasy Football Automatic Manager", announce)
+        ParallelProjectDirector(MODULAR_PIPELINE, instrumentation=instrumentation).construct(builder)
+    else:
+        builder = DetailOrientedBuilder("Fantasy Football Automatic Manager", announce)
+        ProjectDirector(instrumentation).construct(builder)
+    if "json" in options:
+        print(instrumentation.to_json())
+    else:
+        builder.get_result().display()
 
 
 # Client Code (Main Application Logic)
-if __name__ == "__main__":
+if __name__ == "__main__" and sys.argv[1:2] == ["--instrument"]:
+    # args: --instrument [profile] [memory] [json] [parallel]
+    run_instrumented_demo(sys.argv[2:])
+elif __name__ == "__main__" and sys.argv[1:2] == ["--benchmark"]:
+    benchmark_batch(int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+elif __name__ == "__main__" and sys.argv[1:2] == ["--parallel"]:
+    # args: --parallel [thread|process] [cache.json]
+    run_parallel_demo(sys.argv[2] if len(sys.argv) > 2 else "thread",
+                      sys.argv[3] if len(sys.argv) > 3 else None)
+elif __name__ == "__main__":
     # Instance the Concrete Builder (the worker)
     # The Client knows the specific builder needed.
     builder = DetailOrientedBuilder("Fantasy Football Automatic Manager")
@@ -1,3 +1,10 @@
+import math
+import random
+import sqlite3
+import sys
+import time
+from collections import namedtuple
+
 def print_model_documentation():
     "Prints the documentation for the Web-based PHTRS Use Case Diagram."
 
@@ -61,6 +68,542 @@ def print_model_documentation():
             print(f"- {case}")
 
 
+# --- PHTRS backend ---
+# Coordinates are metres east/north of the city's south-west corner.
+CITY_SIZE = 20_000.0
+# Grid cell edge for the spatial index; a duplicate search only touches the 3x3 cells around a point
+CELL_SIZE = 25.0
+CELL_STRIDE = 1 << 20
+# Reports closer than this to an unrepaired pothole are treated as the same pothole
+DUPLICATE_RADIUS = 10.0
+# Districts are square blocks of the city
+DISTRICT_SIZE = 2_000.0
+DISTRICTS_PER_ROW = int(CITY_SIZE // DISTRICT_SIZE)
+
+POTHOLE_STATUSES = ("open", "in work", "temporary repair", "repaired", "not repaired")
+CLAIM_STATUSES = ("filed", "approved", "denied")
+
+Pothole = namedtuple("Pothole", ["id", "x", "y", "district", "address", "size", "priority",
+                                 "status", "report_count", "reported_at"])
+WorkOrder = namedtuple("WorkOrder", ["id", "pothole_id", "crew_id", "crew_size", "equipment",
+                                     "status", "created_at"])
+RepairRecord = namedtuple("RepairRecord", ["id", "work_order_id", "pothole_id", "status", "hours",
+                                           "filler_amount", "cost", "completed_at"])
+DamageClaim = namedtuple("DamageClaim", ["id", "pothole_id", "citizen_name", "address", "phone",
+                                         "damage_type", "amount", "status", "filed_at"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS potholes (
+    id INTEGER PRIMARY KEY,
+    cell INTEGER NOT NULL,
+    x REAL NOT NULL,
+    y REAL NOT NULL,
+    district INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    report_count INTEGER NOT NULL,
+    reported_at REAL NOT NULL
+);
+-- covering index: duplicate and nearby searches never read the table itself
+CREATE INDEX IF NOT EXISTS potholes_by_cell ON potholes (cell, x, y, status);
+CREATE INDEX IF NOT EXISTS potholes_by_district ON potholes (district, status, priority);
+
+CREATE TABLE IF NOT EXISTS district_stats (
+    district INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (district, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS district_stats_insert AFTER INSERT ON potholes BEGIN
+    INSERT INTO district_stats VALUES (NEW.district, NEW.status, 1)
+        ON CONFLICT (district, status) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS district_stats_update AFTER UPDATE OF status ON potholes
+WHEN OLD.status != NEW.status BEGIN
+    UPDATE district_stats SET count = count - 1 WHERE district = OLD.district AND status = OLD.status;
+    INSERT INTO district_stats VALUES (NEW.district, NEW.status, 1)
+        ON CONFLICT (district, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS work_orders (
+    id INTEGER PRIMARY KEY,
+    pothole_id INTEGER NOT NULL REFERENCES potholes (id),
+    crew_id INTEGER NOT NULL,
+    crew_size INTEGER NOT NULL,
+    equipment TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS work_orders_by_crew ON work_orders (crew_id, status);
+CREATE INDEX IF NOT EXISTS work_orders_by_pothole ON work_orders (pothole_id);
+
+CREATE TABLE IF NOT EXISTS repairs (
+    id INTEGER PRIMARY KEY,
+    work_order_id INTEGER NOT NULL REFERENCES work_orders (id),
+    pothole_id INTEGER NOT NULL REFERENCES potholes (id),
+    status TEXT NOT NULL,
+    hours REAL NOT NULL,
+    filler_amount REAL NOT NULL,
+    cost REAL NOT NULL,
+    completed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS repairs_by_pothole ON repairs (pothole_id);
+
+CREATE TABLE IF NOT EXISTS damage_claims (
+    id INTEGER PRIMARY KEY,
+    pothole_id INTEGER REFERENCES potholes (id),
+    citizen_name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    damage_type TEXT NOT NULL,
+    amount REAL NOT NULL,
+    status TEXT NOT NULL,
+    filed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS damage_claims_by_pothole ON damage_claims (pothole_id);
+"""
+
+
+def cell_of(x, y):
+    return int(x // CELL_SIZE) * CELL_STRIDE + int(y // CELL_SIZE)
+
+
+def district_of(x, y):
+    return int(x // DISTRICT_SIZE) * DISTRICTS_PER_ROW + int(y // DISTRICT_SIZE)
+
+
+def repair_priority(size, report_count=1):
+    # size (1-10) dominates; repeat reports raise priority, capped so size still wins
+    return size * 10 + min(report_count, 10) - 1
+
+
+class PotholeTracker:
+    """
+    PHTRS backend on an embedded SQLite store. Potholes carry a grid cell
+    key with a covering (cell, x, y, status) index, so finding nearby
+    reports is a few index range scans however many reports are stored.
+    Per-district status counts are kept current by triggers.
+    """
+
+    def __init__(self, db_path=":memory:"):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # --- Citizen interactions ---
+
+    def report_pothole(self, x, y, size, address="", reported_at=None):
+        """
+        Reports a pothole. A report within DUPLICATE_RADIUS of a pothole that
+        is not yet repaired is merged into it (report count and size go up).
+        Returns (pothole id, True if a new pothole was created).
+        """
+        self._check_location(x, y)
+        if not 1 <= size <= 10:
+            raise ValueError("Pothole size must be between 1 and 10")
+        reported_at = time.time() if reported_at is None else reported_at
+        with self.conn:
+            for pothole_id, _ in self.nearby(x, y, DUPLICATE_RADIUS, include_repaired=False, limit=1):
+                size_now, count = self.conn.execute(
+                    "SELECT size, report_count FROM potholes WHERE id = ?", (pothole_id,)).fetchone()
+                size_now = max(size_now, size)
+                count += 1
+                self.conn.execute(
+                    "UPDATE potholes SET size = ?, report_count = ?, priority = ? WHERE id = ?",
+                    (size_now, count, repair_priority(size_now, count), pothole_id))
+                return pothole_id, False
+            cur = self.conn.execute(
+                "INSERT INTO potholes (cell, x, y, district, address, size, priority, status,"
+                " report_count, reported_at) VALUES (?, ?, ?, ?, ?, ?, ?, 'open', 1, ?)",
+                (cell_of(x, y), x, y, district_of(x, y), address, size,
+                 repair_priority(size), reported_at))
+            return cur.lastrowid, True
+
+    def import_reports(self, reports):
+        """
+        Bulk-loads (x, y, size, address, reported_at) rows in one transaction,
+        without duplicate detection. Meant for migrating existing data.
+        """
+        rows = ((cell_of(x, y), x, y, district_of(x, y), address, size, repair_priority(size), at)
+                for x, y, size, address, at in reports)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO potholes (cell, x, y, district, address, size, priority, status,"
+                " report_count, reported_at) VALUES (?, ?, ?, ?, ?, ?, ?, 'open', 1, ?)", rows)
+
+    def pothole(self, pothole_id):
+        row = self.conn.execute(
+            "SELECT id, x, y, district, address, size, priority, status, report_count, reported_at"
+            " FROM potholes WHERE id = ?", (pothole_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"No pothole with id {pothole_id}")
+        return Pothole(*row)
+
+    def file_damage_claim(self, pothole_id, citizen_name, address, phone, damage_type, amount):
+        if amount < 0:
+            raise ValueError("Claim amount cannot be negative")
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO damage_claims (pothole_id, citizen_name, address, phone, damage_type,"
+                " amount, status, filed_at) VALUES (?, ?, ?, ?, ?, ?, 'filed', ?)",
+                (pothole_id, citizen_name, address, phone, damage_type, amount, time.time()))
+        return cur.lastrowid
+
+    # --- Public Works Staff management ---
+
+    def nearby(self, x, y, radius, include_repaired=True, limit=None):
+        """(pothole id, distance) pairs within radius metres, closest first."""
+        low_x, high_x = int((x - radius) // CELL_SIZE), int((x + radius) // CELL_SIZE)
+        low_y, high_y = int((y - radius) // CELL_SIZE), int((y + radius) // CELL_SIZE)
+        found = []
+        for column in range(low_x, high_x + 1):
+            base = column * CELL_STRIDE
+            for pothole_id, px, py, status in self.conn.execute(
+                    "SELECT id, x, y, status FROM potholes INDEXED BY potholes_by_cell"
+                    " WHERE cell BETWEEN ? AND ?", (base + low_y, base + high_y)):
+                if not include_repaired and status == "repaired":
+                    continue
+                distance = math.hypot(px - x, py - y)
+                if distance <= radius:
+                    found.append((pothole_id, distance))
+        found.sort(key=lambda item: item[1])
+        return found if limit is None else found[:limit]
+
+    def district_counts(self, district):
+        """Number of potholes per status in a district."""
+        return dict(self.conn.execute(
+            "SELECT status, count FROM district_stats WHERE district = ? AND count > 0", (district,)))
+
+    def district_potholes(self, district, status="open", limit=50):
+        """Highest-priority potholes of one status in a district."""
+        cur = self.conn.execute(
+            "SELECT id, x, y, district, address, size, priority, status, report_count, reported_at"
+            " FROM potholes WHERE district = ? AND status = ? ORDER BY priority DESC LIMIT ?",
+            (district, status, limit))
+        return [Pothole(*row) for row in cur]
+
+    def set_priority(self, pothole_id, priority):
+        with self.conn:
+            self.conn.execute("UPDATE potholes SET priority = ? WHERE id = ?", (priority, pothole_id))
+
+    def create_work_order(self, pothole_id, crew_id, crew_size, equipment=""):
+        with self.conn:
+            status = self.conn.execute("SELECT status FROM potholes WHERE id = ?", (pothole_id,)).fetchone()
+            if status is None:
+                raise KeyError(f"No pothole with id {pothole_id}")
+            if status[0] == "repaired":
+                raise ValueError(f"Pothole {pothole_id} is already repaired")
+            cur = self.conn.execute(
+                "INSERT INTO work_orders (pothole_id, crew_id, crew_size, equipment, status, created_at)"
+                " VALUES (?, ?, ?, ?, 'assigned', ?)",
+                (pothole_id, crew_id, crew_size, equipment, time.time()))
+            self.conn.execute("UPDATE potholes SET status = 'in work' WHERE id = ?", (pothole_id,))
+        return cur.lastrowid
+
+    def process_damage_claim(self, claim_id, status):
+        if status not in CLAIM_STATUSES:
+            raise ValueError(f"Claim status must be one of: {', '.join(CLAIM_STATUSES)}")
+        with self.conn:
+            self.conn.execute("UPDATE damage_claims SET status = ? WHERE id = ?", (status, claim_id))
+
+    def damage_claims(self, pothole_id):
+        cur = self.conn.execute(
+            "SELECT id, pothole_id, citizen_name, address, phone, damage_type, amount, status, filed_at"
+            " FROM damage_claims WHERE pothole_id = ?", (pothole_id,))
+        return [DamageClaim(*row) for row in cur]
+
+    # --- Repair Crew workflow ---
+
+    def crew_work_orders(self, crew_id, status="assigned"):
+        cur = self.conn.execute(
+            "SELECT id, pothole_id, crew_id, crew_size, equipment, status, created_at"
+            " FROM work_orders WHERE crew_id = ? AND status = ?", (crew_id, status))
+        return [WorkOrder(*row) for row in cur]
+
+    def record_repair(self, work_order_id, status, hours, filler_amount, cost):
+        """Records repair work, its costs and materials; status becomes the pothole's status."""
+        if status not in POTHOLE_STATUSES[2:]:
+            raise ValueError(f"Repair status must be one of: {', '.join(POTHOLE_STATUSES[2:])}")
+        with self.conn:
+            row = self.conn.execute("SELECT pothole_id FROM work_orders WHERE id = ?", (work_order_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"No work order with id {work_order_id}")
+            pothole_id = row[0]
+            cur = self.conn.execute(
+                "INSERT INTO repairs (work_order_id, pothole_id, status, hours, filler_amount, cost,"
+                " completed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (work_order_id, pothole_id, status, hours, filler_amount, cost, time.time()))
+            self.conn.execute("UPDATE work_orders SET status = 'closed' WHERE id = ?", (work_order_id,))
+            self.conn.execute("UPDATE potholes SET status = ? WHERE id = ?", (status, pothole_id))
+        return cur.lastrowid
+
+    def repairs(self, pothole_id):
+        cur = self.conn.execute(
+            "SELECT id, work_order_id, pothole_id, status, hours, filler_amount, cost, completed_at"
+            " FROM repairs WHERE pothole_id = ?", (pothole_id,))
+        return [RepairRecord(*row) for row in cur]
+
+    @staticmethod
+    def _check_location(x, y):
+        if not (0 <= x < CITY_SIZE and 0 <= y < CITY_SIZE):
+            raise ValueError(f"Location ({x}, {y}) is outside the city")
+
+
+def random_reports(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (rng.uniform(0, CITY_SIZE), rng.uniform(0, CITY_SIZE), rng.randint(1, 10),
+               f"{rng.randint(1, 9999)} Street {i % 500}", 0.0)
+
+
+def benchmark_tracker(num_reports=1_000_000, db_path=":memory:", queries=10_000):
+    """Bulk-loads random reports, then times the interactive queries."""
+    tracker = PotholeTracker(db_path)
+    start = time.perf_counter()
+    tracker.import_reports(random_reports(num_reports))
+    print(f"Loaded {num_reports:,} reports in {time.perf_counter() - start:.1f}s")
+
+    rng = random.Random(1)
+    points = [(rng.uniform(0, CITY_SIZE), rng.uniform(0, CITY_SIZE)) for _ in range(queries)]
+    districts = [rng.randrange(DISTRICTS_PER_ROW ** 2) for _ in range(queries)]
+    checks = [
+        ("nearby (50 m)", lambda i: tracker.nearby(*points[i], 50.0)),
+        ("report (duplicate check)", lambda i: tracker.report_pothole(*points[i], 5)),
+        ("district counts", lambda i: tracker.district_counts(districts[i])),
+        ("district top 20", lambda i: tracker.district_potholes(districts[i], limit=20)),
+    ]
+    for label, query in checks:
+        start = time.perf_counter()
+        for i in range(queries):
+            query(i)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<26} {elapsed / queries * 1e6:8.1f} us/query")
+    tracker.close()
+
+
+class WorkOrderScheduler:
+    """
+    Open potholes in an indexed binary min-heap. Each heap entry records its
+    own position and a dict maps pothole id -> entry, so a repeat report
+    re-prioritises a pothole in O(log n) by sifting it in place.
+
+    Priority is repair_priority(size, report_count) scaled by a per-district
+    weight for location (busy districts > 1.0). Keys pack the priority and
+    the pothole id into one int, so equal priorities go oldest-first and
+    heap comparisons stay cheap.
+    """
+    # entry layout: [key, heap position, pothole id, size, report count, district]
+
+    def __init__(self, district_weights=None):
+        self.district_weights = district_weights or {}
+        self._heap = []
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, pothole_id):
+        return pothole_id in self._entries
+
+    def _key(self, pothole_id, size, report_count, district):
+        priority = repair_priority(size, report_count) * self.district_weights.get(district, 1.0)
+        return -(int(priority * 1000) << 32) + pothole_id % (1 << 32)
+
+    def add(self, pothole_id, size, district, report_count=1):
+        if pothole_id in self._entries:
+            raise ValueError(f"Pothole {pothole_id} is already scheduled")
+        entry = [self._key(pothole_id, size, report_count, district), len(self._heap),
+                 pothole_id, size, report_count, district]
+        self._entries[pothole_id] = entry
+        self._heap.append(entry)
+        self._sift_up(entry[1])
+
+    def add_many(self, potholes):
+        """Adds (pothole id, size, district, report count) rows, heapifying once in O(n)."""
+        heap = self._heap
+        for pothole_id, size, district, report_count in potholes:
+            if pothole_id in self._entries:
+                raise ValueError(f"Pothole {pothole_id} is already scheduled")
+            entry = [self._key(pothole_id, size, report_count, district), len(heap),
+                     pothole_id, size, report_count, district]
+            self._entries[pothole_id] = entry
+            heap.append(entry)
+        for position in reversed(range(len(heap) // 2)):
+            self._sift_down(position)
+
+    def report(self, pothole_id, size):
+        """A new report for a scheduled pothole: bumps its report count and size."""
+        entry = self._entries[pothole_id]
+        entry[3] = max(entry[3], size)
+        entry[4] += 1
+        old_key = entry[0]
+        entry[0] = self._key(pothole_id, entry[3], entry[4], entry[5])
+        if entry[0] < old_key:
+            self._sift_up(entry[1])
+        else:
+            self._sift_down(entry[1])
+
+    def remove(self, pothole_id):
+        # e.g. the pothole was repaired outside the dispatch workflow
+        entry = self._entries.pop(pothole_id)
+        last = self._heap.pop()
+        if last is not entry:
+            position = entry[1]
+            self._heap[position] = last
+            last[1] = position
+            self._sift_up(position)
+            self._sift_down(last[1])
+
+    def peek(self):
+        return self._heap[0][2] if self._heap else None
+
+    def pop(self):
+        """Removes and returns the highest-priority pothole id."""
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            last[1] = 0
+            self._sift_down(0)
+        del self._entries[top[2]]
+        return top[2]
+
+    def assign(self, crew_ids, batch_size):
+        """
+        Hands each crew up to batch_size potholes, dealing in priority order
+        round-robin so every crew gets a comparable share of urgent work.
+        Returns {crew id: [pothole ids]}.
+        """
+        batches = {crew: [] for crew in crew_ids}
+        for _ in range(batch_size):
+            for crew in crew_ids:
+                if not self._heap:
+                    return batches
+                batches[crew].append(self.pop())
+        return batches
+
+    @classmethod
+    def from_tracker(cls, tracker, district_weights=None):
+        """Schedules every open pothole in a PotholeTracker."""
+        scheduler = cls(district_weights)
+        scheduler.add_many(tracker.conn.execute(
+            "SELECT id, size, district, report_count FROM potholes WHERE status = 'open'"))
+        return scheduler
+
+    def dispatch(self, tracker, crews, batch_size):
+        """Assigns batches to crews ({crew id: crew size}) and creates their work orders."""
+        batches = self.assign(list(crews), batch_size)
+        for crew_id, pothole_ids in batches.items():
+            for pothole_id in pothole_ids:
+                tracker.create_work_order(pothole_id, crew_id, crews[crew_id])
+        return batches
+
+    def _sift_up(self, position):
+        heap = self._heap
+        entry = heap[position]
+        key = entry[0]
+        while position:
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+            if key >= parent[0]:
+                break
+            heap[position] = parent
+            parent[1] = position
+            position = parent_position
+        heap[position] = entry
+        entry[1] = position
+
+    def _sift_down(self, position):
+        heap = self._heap
+        size = len(heap)
+        entry = heap[position]
+        key = entry[0]
+        while True:
+            child_position = 2 * position + 1
+            if child_position >= size:
+                break
+            child = heap[child_position]
+            right_position = child_position + 1
+            if right_position < size and heap[right_position][0] < child[0]:
+                child_position = right_position
+                child = heap[right_position]
+            if key <= child[0]:
+                break
+            heap[position] = child
+            child[1] = position
+            position = child_position
+        heap[position] = entry
+        entry[1] = position
+
+
+def simulate_dispatch(num_reports=1_000_000, num_crews=300, rounds=50, batch_size=8,
+                      reports_per_round=20_000, seed=0):
+    """
+    Loads num_reports open potholes, then runs dispatch rounds: each round
+    brings reports_per_round citizen reports (about 70% repeats of scheduled
+    potholes, which re-prioritise them) and assigns a batch to every crew.
+    """
+    rng = random.Random(seed)
+    num_districts = DISTRICTS_PER_ROW ** 2
+    # the central districts see the most traffic
+    centre = DISTRICTS_PER_ROW // 2
+    weights = {district_of(x * DISTRICT_SIZE, y * DISTRICT_SIZE): 1.5
+               for x in range(centre - 2, centre + 2) for y in range(centre - 2, centre + 2)}
+    scheduler = WorkOrderScheduler(weights)
+    crews = list(range(1, num_crews + 1))
+
+    start = time.perf_counter()
+    scheduler.add_many((pothole_id, rng.randint(1, 10), rng.randrange(num_districts), 1)
+                       for pothole_id in range(1, num_reports + 1))
+    print(f"Scheduled {num_reports:,} open potholes in {time.perf_counter() - start:.2f}s")
+
+    next_id = num_reports + 1
+    repeats = new = assigned = 0
+    report_seconds = assign_seconds = 0.0
+    for _ in range(rounds):
+        arrivals = [(rng.randrange(1, next_id), rng.randint(1, 10), rng.random() < 0.7,
+                     rng.randrange(num_districts)) for _ in range(reports_per_round)]
+        start = time.perf_counter()
+        for pothole_id, size, repeat, district in arrivals:
+            if repeat and pothole_id in scheduler:
+                scheduler.report(pothole_id, size)
+                repeats += 1
+            else:
+                scheduler.add(next_id, size, district)
+                next_id += 1
+                new += 1
+        report_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        batches = scheduler.assign(crews, batch_size)
+        assign_seconds += time.perf_counter() - start
+        assigned += sum(len(batch) for batch in batches.values())
+
+    print(f"{rounds} rounds, {num_crews} crews, batches of {batch_size}:")
+    print(f"  reports:     {repeats:,} re-prioritised, {new:,} new, "
+          f"{report_seconds / (repeats + new) * 1e6:.2f} us/report")
+    print(f"  assignments: {assigned:,} work orders, {assign_seconds / rounds * 1000:.2f} ms/round "
+          f"({assign_seconds / assigned * 1e6:.2f} us/order)")
+    print(f"  still open:  {len(scheduler):,}")
+
+
 # Execute the function to print the documentation
 if __name__ == "__main__":
-    print_model_documentation()
\ No newline at end of file
+    if sys.argv[1:2] == ["--simulate"]:
+        # args: --simulate [open reports] [crews]
+        simulate_dispatch(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000,
+                          int(sys.argv[3]) if len(sys.argv) > 3 else 300)
+    elif sys.argv[1:2] == ["--benchmark"]:
+        # args: --benchmark [reports] [db path]
+        benchmark_tracker(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000,
+                          sys.argv[3] if len(sys.argv) > 3 else ":memory:")
+    else:
+        print_model_documentation()
\ No newline at end of file
@@ -1,6 +1,16 @@
+import argparse
+import csv
 import math
+import numbers
+import os
 import sys
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, TextIO, Union
 
 # ==============================================================================
 # I. THE STEPWISE REFINEMENT ALGORITHM (Design Outline)
@@ -27,8 +37,9 @@ from typing import List, Optional
 # ------------------------------------------------------------------------------
 
 # Procedure: _parse_amount(amount)
-# 1. Separate the float 'amount' into an integer dollar component and an integer cent component (0-99).
-# 2. Return (dollars, cents).
+# 1. Convert the 'amount' (float, int, Decimal, numeric string or integer cents) into exact total cents.
+# 2. Separate the total into an integer dollar component and an integer cent component (0-99).
+# 3. Return (dollars, cents).
 
 # Procedure: _convert_dollars(dollars)
 # 1. Loop through the integer 'dollars' in 3-digit groups (e.g., hundreds, thousands, millions).
@@ -79,54 +90,168 @@ TENS_WORDS = {
 # The names for the magnitude blocks
 MAGNITUDES = ["", "Thousand", "Million", "Billion", "Trillion"] 
 
+# The largest dollar amount the magnitude names can spell (999 Trillion ...)
+MAX_DOLLARS = 1000 ** len(MAGNITUDES) - 1
+
+# Numeric types accepted by the L1 interface
+Amount = Union[float, int, Decimal, str]
+
+NEGATIVE_AMOUNT_ERROR = "ERROR: Negative amounts are not supported for check writing."
+OVERFLOW_AMOUNT_ERROR = f"ERROR: Amounts above ${MAX_DOLLARS:,}.99 are not supported for check writing."
+
 # ==============================================================================
 # III. LEVEL 3 ABSTRACTION: CORE PRIMITIVES (0 - 999 Conversion)
-# Most refined, reusable logic blocks.
+# Most refined, reusable logic blocks, compiled once per locale into lookup
+# tables and resolved through a lazily loaded locale registry.
 # ==============================================================================
 
-def _convert_two_digits(n: int) -> str:
+DEFAULT_LOCALE = "en_US"
+
+
+class LocaleTables:
     """
-    [L3] Converts a number from 0 to 99 into words. (Core Primitive)
+    Compiled number-to-words tables for one locale.
+
+    Built from the locale's ones/teens/tens/magnitude words plus its
+    hyphenation and "and" rules. All 1000 three-digit blocks, with and without
+    magnitude names, are precomputed so conversions are plain list lookups.
     """
-    if n == 0:
-        return ""
-    if 0 < n < 10:
-        return ONES_WORDS[n]
-    if 10 <= n < 20:
-        return TEENS_WORDS[n]
-    
-    # Numbers >= 20
-    tens_digit = n // 10
-    ones_digit = n % 10
-    
-    tens_part = TENS_WORDS.get(tens_digit, "")
-    ones_part = ONES_WORDS.get(ones_digit, "")
 
-    # Handles hyphenation if needed, simple space is common for checks
-    result = (tens_part + " " + ones_part).strip()
-    return result
+    def __init__(self, name: str, ones: Dict[int, str], teens: Dict[int, str],
+                 tens: Dict[int, str], hundred: str, magnitudes: List[str],
+                 zero: str = "Zero", cents_joiner: str = "and",
+                 hyphenate_tens: bool = False, hundred_joiner: Optional[str] = None):
+        if len(magnitudes) != len(MAGNITUDES):
+            raise ValueError(f"Locale '{name}' must define {len(MAGNITUDES)} magnitude names")
+        self.name = name
+        self.ones = ones
+        self.teens = teens
+        self.tens = tens
+        self.hundred = hundred
+        self.magnitudes = magnitudes
+        self.zero = zero
+        self.cents_joiner = cents_joiner
+        self.hyphenate_tens = hyphenate_tens
+        self.hundred_joiner = hundred_joiner
+
+        self.three_digit_words = [self.convert_three_digits(n) for n in range(1000)]
+        # block_tables[i][n] holds block 'n' already suffixed with magnitudes[i]
+        self.block_tables = [self.three_digit_words]
+        for magnitude_name in magnitudes[1:]:
+            self.block_tables.append([f"{words} {magnitude_name}" if words else ""
+                                      for words in self.three_digit_words])
+
+    def convert_two_digits(self, n: int) -> str:
+        """
+        [L3] Converts a number from 0 to 99 into words. (Core Primitive)
+        """
+        if n == 0:
+            return ""
+        if 0 < n < 10:
+            return self.ones[n]
+        if 10 <= n < 20:
+            return self.teens[n]
+
+        # Numbers >= 20
+        tens_digit = n // 10
+        ones_digit = n % 10
+
+        tens_part = self.tens.get(tens_digit, "")
+        ones_part = self.ones.get(ones_digit, "")
+
+        # Simple space is common for checks; some locales hyphenate (Twenty-One)
+        if self.hyphenate_tens and ones_part:
+            return f"{tens_part}-{ones_part}"
+        return (tens_part + " " + ones_part).strip()
+
+    def convert_three_digits(self, n: int) -> str:
+        """
+        [L3] Converts a number from 0 to 999 into words.
+        (Refinement: It calls the L3 primitive convert_two_digits.)
+        """
+        if n == 0:
+            return ""
+
+        hundreds_digit = n // 100
+        remainder = n % 100
+
+        parts: List[str] = []
+
+        if hundreds_digit > 0:
+            parts.append(f"{self.ones[hundreds_digit]} {self.hundred}")
+            # e.g. "One Hundred and Five" where the locale requires it
+            if remainder > 0 and self.hundred_joiner:
+                parts.append(self.hundred_joiner)
+
+        if remainder > 0:
+            parts.append(self.convert_two_digits(remainder))
+
+        return " ".join(parts).strip()
+
+
+def _english_us() -> LocaleTables:
+    return LocaleTables("en_US", ONES_WORDS, TEENS_WORDS, TENS_WORDS, "Hundred", MAGNITUDES)
+
+
+def _english_gb() -> LocaleTables:
+    # "Pounds and" closes the whole-number words, so "One Hundred and Five Pounds
+    # and 00/100" cannot be misread the way a bare "and" could
+    return LocaleTables("en_GB", ONES_WORDS, TEENS_WORDS, TENS_WORDS, "Hundred", MAGNITUDES,
+                        cents_joiner="Pounds and", hyphenate_tens=True, hundred_joiner="and")
+
+
+# Locale name -> factory; tables are only compiled the first time a locale is used.
+_LOCALE_FACTORIES: Dict[str, Callable[[], LocaleTables]] = {
+    "en_US": _english_us,
+    "en_GB": _english_gb,
+}
+_LOADED_LOCALES: Dict[str, LocaleTables] = {}
+_LOCALE_LOCK = threading.Lock()
+
 
-def _convert_three_digits(n: int) -> str:
+def register_locale(name: str, factory: Callable[[], LocaleTables]) -> None:
     """
-    [L3] Converts a number from 0 to 999 into words. 
-    (Refinement: It calls the L3 primitive _convert_two_digits.)
+    Registers (or replaces) a locale. 'factory' is called lazily on first use.
     """
-    if n == 0:
-        return ""
+    with _LOCALE_LOCK:
+        _LOCALE_FACTORIES[name] = factory
+        _LOADED_LOCALES.pop(name, None)
 
-    hundreds_digit = n // 100
-    remainder = n % 100
-    
-    parts: List[str] = []
 
-    if hundreds_digit > 0:
-        parts.append(f"{ONES_WORDS[hundreds_digit]} Hundred")
+def available_locales() -> List[str]:
+    """Returns the names of all registered locales."""
+    return sorted(_LOCALE_FACTORIES)
+
+
+def get_locale(name: str = DEFAULT_LOCALE) -> LocaleTables:
+    """
+    Returns the compiled tables for 'name', building them on first use.
+    """
+    tables = _LOADED_LOCALES.get(name)
+    if tables is None:
+        with _LOCALE_LOCK:
+            tables = _LOADED_LOCALES.get(name)
+            if tables is None:
+                factory = _LOCALE_FACTORIES.get(name)
+                if factory is None:
+                    raise ValueError(f"Unknown locale '{name}'; expected one of {available_locales()}")
+                tables = factory()
+                _LOADED_LOCALES[name] = tables
+    return tables
+
+
+def _convert_two_digits(n: int, locale: str = DEFAULT_LOCALE) -> str:
+    """
+    [L3] Converts a number from 0 to 99 into words. (Core Primitive)
+    """
+    return get_locale(locale).convert_two_digits(n)
 
-    if remainder > 0:
-        # Calls the lower-level L3 primitive: _convert_two_digits
-        parts.append(_convert_two_digits(remainder))
 
-    return " ".join(parts).strip()
+def _convert_three_digits(n: int, locale: str = DEFAULT_LOCALE) -> str:
+    """
+    [L3] Converts a number from 0 to 999 into words via the compiled tables.
+    """
+    return get_locale(locale).three_digit_words[n]
 
 
 # ==============================================================================
@@ -134,14 +259,29 @@ def _convert_three_digits(n: int) -> str:
 # Breaks down the total amount into its constituent parts.
 # ==============================================================================
 
-def _convert_dollars(dollars: int) -> str:
+def _join_dollar_blocks(words: List[str], dollars: int, tables: LocaleTables) -> str:
+    """
+    [L2] Joins block words collected lowest magnitude first. Locales with an
+    "and" rule also put it before a final block under 100 ("One Thousand and Five").
+    """
+    words.reverse()
+    last_block = dollars % 1000
+    if tables.hundred_joiner and dollars >= 1000 and 0 < last_block < 100:
+        words.insert(len(words) - 1, tables.hundred_joiner)
+    return " ".join(words)
+
+
+def _convert_dollars(dollars: int, locale: str = DEFAULT_LOCALE) -> str:
     """
     [L2] Converts a large integer (the dollar amount) into words 
     by breaking it into 3-digit groups (blocks) and appending magnitude names.
-    (Delegation: This function calls the L3 primitive: _convert_three_digits.)
+    (Delegation: This function uses the locale's compiled L3 block tables.)
     """
+    tables = get_locale(locale)
     if dollars == 0:
-        return "Zero"
+        return tables.zero
+    if dollars > MAX_DOLLARS:
+        raise OverflowError(f"{dollars} exceeds the '{MAGNITUDES[-1]}' magnitude ceiling")
 
     words: List[str] = []
     i = 0  # Magnitude index 
@@ -151,21 +291,14 @@ def _convert_dollars(dollars: int) -> str:
         three_digit_block = temp_dollars % 1000 
         
         if three_digit_block > 0:
-            # Calls the L3 primitive to convert the block to words
-            block_words = _convert_three_digits(three_digit_block)
-            magnitude_name = MAGNITUDES[i]
-            
-            # Add magnitude only if it's not the ones block (i > 0)
-            if i > 0:
-                words.append(f"{block_words} {magnitude_name}")
-            else:
-                words.append(block_words)
+            # Block words with the magnitude name already appended (i > 0)
+            words.append(tables.block_tables[i][three_digit_block])
 
         temp_dollars //= 1000
         i += 1
     
     # Reverse to get correct order
-    return " ".join(reversed(words)).strip()
+    return _join_dollar_blocks(words, dollars, tables)
 
 
 def _convert_cents(cents: int) -> str:
@@ -176,15 +309,49 @@ def _convert_cents(cents: int) -> str:
     return f"{cents_str}/100"
 
 
-def _parse_amount(amount: float) -> tuple[int, int]:
+def _to_total_cents(amount: Amount, in_cents: bool = False) -> int:
     """
-    [L2] Separates a float amount into its dollar and cent components.
+    [L2] Converts an amount into an exact, signed number of cents.
+
+    Floats are rounded once on the scaled value, so the cent part can never
+    come out as 100. Decimals and numeric strings (e.g. "1,234.56" or "$19.99"
+    from a ledger file) are split exactly, rounding half-up on fractions of a
+    cent. Integers of any type (including NumPy scalars) are scaled as Python
+    ints. With in_cents=True the amount is already an integer number of cents.
     """
-    dollars = int(amount)
-    # Use careful rounding to avoid floating-point errors
-    cents = int(round((amount - dollars) * 100))
-    
-    return dollars, cents
+    if isinstance(amount, str):
+        text = amount.strip().replace(",", "").lstrip("$")
+        try:
+            amount = Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"Not a numeric amount: {amount!r}") from None
+
+    if isinstance(amount, Decimal):
+        if not amount.is_finite():
+            raise ValueError(f"Not a finite amount: {amount}")
+        if in_cents:
+            if amount != amount.to_integral_value():
+                raise ValueError(f"Cent amounts must be whole numbers: {amount}")
+            return int(amount)
+        return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+    if isinstance(amount, numbers.Integral):
+        # NumPy integers too: scaling them in int64 would wrap around
+        amount = int(amount)
+        return amount if in_cents else amount * 100
+
+    if in_cents:
+        if amount != int(amount):
+            raise ValueError(f"Cent amounts must be whole numbers: {amount}")
+        return int(amount)
+    return int(round(amount * 100))
+
+
+def _parse_amount(amount: Amount, in_cents: bool = False) -> tuple[int, int]:
+    """
+    [L2] Separates an amount into its dollar and cent components.
+    """
+    return divmod(_to_total_cents(amount, in_cents), 100)
 
 
 # ==============================================================================
@@ -192,7 +359,8 @@ def _parse_amount(amount: float) -> tuple[int, int]:
 # Orchestrates the Level 2 components to deliver the final result.
 # ==============================================================================
 
-def write_amount_in_words(amount: float) -> str:
+def write_amount_in_words(amount: Amount, in_cents: bool = False,
+                          locale: str = DEFAULT_LOCALE) -> str:
     """
     [L1] The highest level of abstraction. Given a numeric amount, it returns 
     the full, formatted check amount in words.
@@ -200,33 +368,540 @@ def write_amount_in_words(amount: float) -> str:
     (Orchestration: Calls the L2 primitives: _parse_amount, _convert_dollars, _convert_cents.)
 
     Args:
-        amount: The total numeric dollar amount (e.g., 1234.56).
+        amount: The total dollar amount as a float, int, Decimal or numeric
+            string (e.g., 1234.56, Decimal("1234.56") or "1,234.56").
+        in_cents: Treat 'amount' as a whole number of cents (e.g., 123456).
+        locale: Registered locale whose number words are used (e.g., "en_GB").
 
     Returns:
         The final formatted string for the check (e.g., "One Thousand Two Hundred Thirty Four and 56/100").
     """
-    if amount < 0:
-        return "ERROR: Negative amounts are not supported for check writing."
-    
     # 1. Calls L2 to break the amount down
-    dollars, cents = _parse_amount(amount) 
+    total_cents = _to_total_cents(amount, in_cents)
+    if total_cents < 0:
+        return NEGATIVE_AMOUNT_ERROR
+    dollars, cents = divmod(total_cents, 100)
+    if dollars > MAX_DOLLARS:
+        return OVERFLOW_AMOUNT_ERROR
     
     # 2. Calls L2 to convert the dollar part
-    dollar_words = _convert_dollars(dollars)
+    dollar_words = _convert_dollars(dollars, locale)
     
     # 3. Calls L2 to convert the cent part
     cent_fraction = _convert_cents(cents)
     
     # 4. Assembles the final, formatted output
-    return f"{dollar_words} and {cent_fraction}"
+    return f"{dollar_words} {get_locale(locale).cents_joiner} {cent_fraction}"
 
 
 # ==============================================================================
-# VI. EXECUTION BLOCK
+# VI. BATCH CONVERSION (Precomputed Lookup Tables)
+# Converts whole columns of amounts without re-deriving the L3 primitives.
+# ==============================================================================
+
+def _convert_dollars_from_tables(dollars: int, tables: LocaleTables) -> str:
+    """
+    [L2] Loop-free for amounts under 1000, otherwise one lookup per block.
+    """
+    blocks = tables.block_tables
+    if dollars < 1000:
+        return blocks[0][dollars] if dollars else tables.zero
+
+    words: List[str] = []
+    remaining = dollars
+    for table in blocks:
+        if not remaining:
+            break
+        block = table[remaining % 1000]
+        if block:
+            words.append(block)
+        remaining //= 1000
+
+    return _join_dollar_blocks(words, dollars, tables)
+
+
+def iter_amounts_in_words(amounts: Iterable[Amount], in_cents: bool = False,
+                          locale: str = DEFAULT_LOCALE) -> Iterator[str]:
+    """
+    [L1] Lazily converts a stream of amounts, yielding the same strings as
+    write_amount_in_words for each one.
+
+    Args:
+        amounts: Any iterable of numeric amounts (list, array, generator...).
+        in_cents: Treat each amount as a whole number of cents.
+        locale: Registered locale whose number words are used.
+
+    Yields:
+        The formatted check string for each amount, in input order.
+    """
+    tables = get_locale(locale)
+    joiner = f" {tables.cents_joiner} "
+    to_cents = _to_total_cents
+    convert = _convert_dollars_from_tables
+    for amount in amounts:
+        total_cents = to_cents(amount, in_cents)
+        if total_cents < 0:
+            yield NEGATIVE_AMOUNT_ERROR
+            continue
+        dollars, cents = divmod(total_cents, 100)
+        if dollars > MAX_DOLLARS:
+            yield OVERFLOW_AMOUNT_ERROR
+            continue
+        yield f"{convert(dollars, tables)}{joiner}{cents:02d}/100"
+
+
+def write_amounts_in_words(amounts: Iterable[Amount], in_cents: bool = False,
+                           locale: str = DEFAULT_LOCALE) -> List[str]:
+    """
+    [L1] Batch version of write_amount_in_words.
+
+    Args:
+        amounts: Any iterable of numeric amounts (list, array, generator...).
+        in_cents: Treat each amount as a whole number of cents.
+        locale: Registered locale whose number words are used.
+
+    Returns:
+        A list with the formatted check string for each amount, in input order.
+    """
+    return list(iter_amounts_in_words(amounts, in_cents, locale))
+
+
+def _reference_amount_in_words(amount: Amount, locale: str = DEFAULT_LOCALE) -> str:
+    """
+    The original per-amount conversion, kept as the benchmark baseline: every
+    block is re-derived digit by digit and suffixed with its magnitude name.
+    """
+    tables = get_locale(locale)
+    total_cents = _to_total_cents(amount)
+    if total_cents < 0:
+        return NEGATIVE_AMOUNT_ERROR
+    dollars, cents = divmod(total_cents, 100)
+    if dollars > MAX_DOLLARS:
+        return OVERFLOW_AMOUNT_ERROR
+
+    if dollars == 0:
+        dollar_words = tables.zero
+    else:
+        words: List[str] = []
+        i = 0
+        temp_dollars = dollars
+        while temp_dollars > 0:
+            three_digit_block = temp_dollars % 1000
+            if three_digit_block > 0:
+                block_words = tables.convert_three_digits(three_digit_block)
+                if i > 0:
+                    block_words += f" {tables.magnitudes[i]}"
+                words.append(block_words)
+            temp_dollars //= 1000
+            i += 1
+        dollar_words = _join_dollar_blocks(words, dollars, tables)
+    return f"{dollar_words} {tables.cents_joiner} {_convert_cents(cents)}"
+
+
+def benchmark_batch(count: int = 200_000) -> None:
+    """
+    Times the original per-amount conversion against the batch API.
+    """
+    amounts = [((i * 7919) % 10_000_000_000) + (i % 100) / 100 for i in range(count)]
+
+    start = time.perf_counter()
+    loop_results = [_reference_amount_in_words(amount) for amount in amounts]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_results = write_amounts_in_words(amounts)
+    batch_seconds = time.perf_counter() - start
+
+    assert loop_results == batch_results, "Batch output differs from per-amount output"
+    print(f"--- Batch Benchmark ({count:,} amounts) ---")
+    print(f"Per-amount loop: {loop_seconds:.3f}s")
+    print(f"Batch API:       {batch_seconds:.3f}s ({loop_seconds / batch_seconds:.1f}x)")
+
+
+def benchmark_locales(count: int = 200_000) -> None:
+    """
+    Times the first-use table load and batch conversion for every registered locale.
+    """
+    amounts = [((i * 7919) % 10_000_000_000) + (i % 100) / 100 for i in range(count)]
+    print(f"--- Locale Benchmark ({count:,} amounts) ---")
+    for name in available_locales():
+        _LOADED_LOCALES.pop(name, None)
+        start = time.perf_counter()
+        get_locale(name)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_amounts_in_words(amounts, locale=name)
+        batch_seconds = time.perf_counter() - start
+        print(f"{name}: load {load_seconds * 1000:.2f}ms, batch {batch_seconds:.3f}s")
+
+
+# ==============================================================================
+# VII. STREAMING PIPELINE (Ledger File -> Check Text)
+# Reads amounts in fixed-size chunks and fans them out to a process pool while
+# writing results back in input order with a bounded number of chunks in flight.
+# ==============================================================================
+
+def _convert_chunk(lines: List[str], column: Optional[int], in_cents: bool,
+                   locale: str = DEFAULT_LOCALE) -> str:
+    """
+    Converts one chunk of raw input lines into tab-separated output lines,
+    exactly one per input line (blank lines give a blank "\t" line) so an
+    output line count is always a valid --offset.
+    (Runs inside a worker process.)
+    """
+    if column is None:
+        raw_amounts = [line.strip() for line in lines]
+    else:
+        raw_amounts = [row[column].strip() if len(row) > column else ""
+                       for row in csv.reader(lines)]
+
+    tables = get_locale(locale)
+    output: List[str] = []
+    for raw in raw_amounts:
+        if not raw:
+            output.append("\t\n")
+            continue
+        try:
+            total_cents = _to_total_cents(raw, in_cents)
+        except ValueError as e:
+            output.append(f"{raw}\tERROR: {e}\n")
+            continue
+        dollars, cents = divmod(total_cents, 100)
+        if total_cents < 0:
+            words = NEGATIVE_AMOUNT_ERROR
+        elif dollars > MAX_DOLLARS:
+            words = OVERFLOW_AMOUNT_ERROR
+        else:
+            words = f"{_convert_dollars_from_tables(dollars, tables)} {tables.cents_joiner} {cents:02d}/100"
+        output.append(f"{raw}\t{words}\n")
+    return "".join(output)
+
+
+def _read_chunks(source: TextIO, chunk_size: int) -> Iterator[List[str]]:
+    """
+    Yields lists of at most chunk_size lines until the source is exhausted.
+    """
+    while True:
+        chunk = list(islice(source, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_stream(source: TextIO, sink: TextIO, workers: int = 1,
+                   chunk_size: int = 10_000, offset: int = 0,
+                   column: Optional[int] = None, in_cents: bool = False,
+                   locale: str = DEFAULT_LOCALE,
+                   on_chunk: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Converts every amount in 'source' (one per line, or one CSV column) and
+    writes "amount<TAB>words" lines to 'sink' in input order, one output line
+    per input line. The sink is flushed after every chunk.
+
+    Args:
+        source: Text stream of ledger lines.
+        sink: Text stream receiving the converted lines.
+        workers: Number of worker processes (1 converts in this process).
+        chunk_size: Number of input lines handed to a worker at a time.
+        offset: Number of input lines to skip, for resuming an interrupted run.
+        column: Zero-based CSV column holding the amount (None = whole line).
+        in_cents: Treat each amount as a whole number of cents.
+        locale: Registered locale whose number words are used.
+        on_chunk: Called with the consumed line count after each chunk is flushed.
+
+    Returns:
+        The number of input lines consumed, including the skipped offset.
+    """
+    consumed = sum(1 for _ in islice(source, offset))
+    chunks = _read_chunks(source, chunk_size)
+
+    def emit(text: str, size: int) -> None:
+        nonlocal consumed
+        sink.write(text)
+        sink.flush()
+        consumed += size
+        if on_chunk is not None:
+            on_chunk(consumed)
+
+    if workers <= 1:
+        for chunk in chunks:
+            emit(_convert_chunk(chunk, column, in_cents, locale), len(chunk))
+        return consumed
+
+    # Only a few chunks per worker are ever pending, so memory stays constant.
+    max_in_flight = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            if len(pending) >= max_in_flight:
+                size, future = pending.popleft()
+                emit(future.result(), size)
+            pending.append((len(chunk), pool.submit(_convert_chunk, chunk, column, in_cents, locale)))
+        while pending:
+            size, future = pending.popleft()
+            emit(future.result(), size)
+    return consumed
+
+
+def _open_for_resume(path: str, offset: int) -> TextIO:
+    """
+    Opens an output file for resuming at input line 'offset'. The file is cut
+    back to exactly 'offset' lines first, dropping any partly written chunk.
+    """
+    handle = open(path, "r+")
+    for _ in range(offset):
+        if not handle.readline().endswith("\n"):
+            handle.close()
+            raise ValueError(f"{path} has fewer than {offset} complete lines; cannot resume there")
+    handle.truncate(handle.tell())
+    handle.seek(0, os.SEEK_END)
+    return handle
+
+
+def main_convert(argv: List[str]) -> int:
+    """
+    Command-line entry point: python CT6.py convert [FILE] [options]
+    """
+    parser = argparse.ArgumentParser(
+        prog="CT6.py convert",
+        description="Convert a ledger of amounts into check text, one line per amount.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="ledger file to read (default: stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="file to write (default: stdout); appended to when resuming")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=10_000,
+                        help="input lines per worker task (default: 10000)")
+    parser.add_argument("--offset", type=int, default=0,
+                        help="number of input lines to skip when resuming a run")
+    parser.add_argument("--column", type=int, default=None,
+                        help="zero-based CSV column holding the amount")
+    parser.add_argument("--cents", action="store_true",
+                        help="amounts are whole numbers of cents")
+    parser.add_argument("--locale", default=DEFAULT_LOCALE, choices=available_locales(),
+                        help=f"number words to use (default: {DEFAULT_LOCALE})")
+    args = parser.parse_args(argv)
+
+    if args.output == "-":
+        sink = sys.stdout
+    elif args.offset and os.path.exists(args.output):
+        try:
+            sink = _open_for_resume(args.output, args.offset)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        sink = open(args.output, "w")
+    source = sys.stdin if args.input == "-" else open(args.input, newline="")
+
+    def report(consumed: int) -> None:
+        # everything up to 'consumed' is flushed, so an interrupted run can resume here
+        print(f"Converted through input line {consumed:,} (resume with --offset {consumed}).",
+              file=sys.stderr, flush=True)
+
+    try:
+        convert_stream(source, sink, workers=args.workers,
+                       chunk_size=args.chunk_size, offset=args.offset,
+                       column=args.column, in_cents=args.cents,
+                       locale=args.locale, on_chunk=report)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+# ==============================================================================
+# VIII. CACHED CONVERSION (Repeated Amounts)
+# Bounded, thread-safe caches in front of the L1 and L2 conversions for runs
+# where the same amounts (rent, salaries, subscriptions) recur many times.
+# ==============================================================================
+
+CACHE_POLICIES = ("lru", "lfu", "fifo")
+
+
+class AmountCache:
+    """
+    A bounded key -> string cache capped by entry count and approximate memory.
+
+    Eviction policies:
+        "lru":  evicts the least recently used entry.
+        "lfu":  evicts the least frequently used entry (oldest first on ties).
+        "fifo": evicts the oldest inserted entry.
+    """
+
+    def __init__(self, max_entries: int = 100_000, max_bytes: Optional[int] = None,
+                 policy: str = "lru"):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy '{policy}'; expected one of {CACHE_POLICIES}")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_used = 0
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        # LFU bookkeeping: key -> use count, and use count -> keys in insertion order
+        self._counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_size(key: Hashable, value: str) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def _touch_lfu(self, key: Hashable) -> None:
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def _evict_one(self) -> None:
+        if self.policy == "lfu":
+            bucket = self._buckets[self._min_count]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+                # one put may need several evictions; move on to the next lowest count
+                self._min_count = min(self._buckets) if self._buckets else 0
+            del self._counts[key]
+            value = self._entries.pop(key)
+        else:
+            key, value = self._entries.popitem(last=False)
+        self.bytes_used -= self._entry_size(key, value)
+        self.evictions += 1
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Returns the cached value for 'key', or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.policy == "lru":
+                self._entries.move_to_end(key)
+            elif self.policy == "lfu":
+                self._touch_lfu(key)
+            return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        """Stores 'value' under 'key', evicting entries to stay within the caps."""
+        size = self._entry_size(key, value)
+        with self._lock:
+            if key in self._entries:
+                return
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            while self._entries and (
+                    len(self._entries) >= self.max_entries
+                    or (self.max_bytes is not None and self.bytes_used + size > self.max_bytes)):
+                self._evict_one()
+            self._entries[key] = value
+            self.bytes_used += size
+            if self.policy == "lfu":
+                self._counts[key] = 1
+                self._buckets.setdefault(1, OrderedDict())[key] = None
+                self._min_count = 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """
+        Returns the cached value for 'key', computing and storing it on a miss.
+        (The computation runs outside the lock so slow misses do not block hits.)
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._counts.clear()
+            self._buckets.clear()
+            self._min_count = 0
+            self.hits = self.misses = self.evictions = self.bytes_used = 0
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        """Returns hit/miss/eviction counters and memory use for tuning."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "policy": self.policy,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes_used": self.bytes_used,
+            }
+
+
+class CachedCheckWriter:
+    """
+    Check writer with one cache keyed on exact total cents (so 100.0, "100.00"
+    and Decimal("100") share an entry) and one keyed on whole dollar amounts.
+    max_entries applies to each cache; max_bytes is the budget for the writer
+    as a whole and is split evenly between the two caches.
+    Safe to share across threads.
+    """
+
+    def __init__(self, max_entries: int = 100_000, max_bytes: Optional[int] = None,
+                 policy: str = "lru", locale: str = DEFAULT_LOCALE):
+        self.locale = locale
+        per_cache_bytes = None if max_bytes is None else max_bytes // 2
+        self.amount_cache = AmountCache(max_entries, per_cache_bytes, policy)
+        self.dollar_cache = AmountCache(max_entries, per_cache_bytes, policy)
+
+    def convert_dollars(self, dollars: int) -> str:
+        """[L2] Cached _convert_dollars."""
+        return self.dollar_cache.get_or_compute(dollars, lambda: _convert_dollars(dollars, self.locale))
+
+    def write_amount_in_words(self, amount: Amount, in_cents: bool = False) -> str:
+        """[L1] Cached write_amount_in_words."""
+        total_cents = _to_total_cents(amount, in_cents)
+        return self.amount_cache.get_or_compute(total_cents, lambda: self._compose(total_cents))
+
+    def _compose(self, total_cents: int) -> str:
+        if total_cents < 0:
+            return NEGATIVE_AMOUNT_ERROR
+        dollars, cents = divmod(total_cents, 100)
+        if dollars > MAX_DOLLARS:
+            return OVERFLOW_AMOUNT_ERROR
+        joiner = get_locale(self.locale).cents_joiner
+        return f"{self.convert_dollars(dollars)} {joiner} {_convert_cents(cents)}"
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float, str]]]:
+        """Returns the counters of both caches."""
+        return {"amounts": self.amount_cache.stats(), "dollars": self.dollar_cache.stats()}
+
+
+# ==============================================================================
+# IX. EXECUTION BLOCK
 # Handles user interaction to demonstrate the final algorithm.
 # ==============================================================================
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["convert"]:
+        sys.exit(main_convert(sys.argv[2:]))
+    if "--benchmark" in sys.argv[1:]:
+        benchmark_batch()
+        benchmark_locales()
+        sys.exit(0)
+
     print("--- Check Writer Program (Stepwise Refinement Demo) ---")
     
     # Example test cases
@@ -2,177 +2,847 @@
 # This script documents the execution flow of the ATM State Machine Diagram
 # by printing the states, events, guards, and actions in sequence for key
 # operations depicted in my UML diagram.
+#
+# The diagram is expressed as data: states and events are integer ids, and a
+# compiled transition table maps (state, event) to guarded transitions whose
+# guards and actions are callables. The operations below are event sequences
+# replayed through the engine, which prints each transition as it fires.
 
+import argparse
+import heapq
+import json
+import os
+import random
+import struct
+import sys
 import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+def format_separator(title):
+    """Returns the descriptive separator for an operational sequence."""
+    rule = "=" * 80
+    return f"\n{rule}\n| {title:^76} |\n{rule}\n"
+
+def format_step(step_number, current_state, transition_event, transition_action, next_state):
+    """Returns a formatted step showing the state change."""
+    return (f"\n[{step_number}] CURRENT STATE: {current_state}\n"
+            f"    EVENT TRIGGERED: {transition_event}\n"
+            f"    ACTION / GUARD: {transition_action}\n"
+            f"    -> NEXT STATE: {next_state}\n")
 
 def print_separator(title):
     """Prints a descriptive separator for each operational sequence."""
-    print("\n" + "=" * 80)
-    print(f"| {title:^76} |")
-    print("=" * 80)
+    sys.stdout.write(format_separator(title))
 
 def print_step(step_number, current_state, transition_event, transition_action, next_state):
     """Prints a formatted step showing the state change."""
-    print(f"\n[{step_number}] CURRENT STATE: {current_state}")
-    print(f"    EVENT TRIGGERED: {transition_event}")
-    print(f"    ACTION / GUARD: {transition_action}")
-    print(f"    -> NEXT STATE: {next_state}")
+    sys.stdout.write(format_step(step_number, current_state, transition_event,
+                                 transition_action, next_state))
 
-# --- OPERATION 1: SUCCESSFUL WITHDRAWAL SEQUENCE ---
+# --- TRACE SINKS ---
+# Every sink accepts separator/text/step records and buffers them until flush(),
+# which hands the whole batch to the output stream in a single write. Once
+# max_bytes are buffered (characters for the text sinks) the sink flushes
+# itself, so long trace dumps hold at most one batch in memory; pass
+# max_bytes=None to buffer everything until flush().
 
-def successful_withdrawal_sequence():
-    """Prints the full sequence for a customer successfully withdrawing money."""
-    print_separator("OPERATION 1: SUCCESSFUL WITHDRAWAL SEQUENCE")
+TRACE_BUFFER_BYTES = 1 << 20
+
+class TextTraceSink:
+    """Human-readable trace, identical to the print_separator/print_step output."""
+
+    def __init__(self, stream=None, max_bytes=TRACE_BUFFER_BYTES):
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_bytes = max_bytes
+        self.parts = []
+        self.buffered = 0
+
+    def _append(self, part):
+        self.parts.append(part)
+        self.buffered += len(part)
+        if self.max_bytes is not None and self.buffered >= self.max_bytes:
+            self.flush()
+
+    def separator(self, title):
+        self._append(format_separator(title))
+
+    def text(self, line):
+        self._append(line + "\n")
+
+    def step(self, step_number, current_state, transition_event, transition_action, next_state):
+        self._append(format_step(step_number, current_state, transition_event,
+                                 transition_action, next_state))
+
+    def flush(self):
+        self.stream.write("".join(self.parts))
+        self.parts.clear()
+        self.buffered = 0
+
+class JsonLinesTraceSink(TextTraceSink):
+    """One JSON object per record, for loading traces into other tools."""
+
+    def separator(self, title):
+        self._append(json.dumps({"type": "separator", "title": title}) + "\n")
+
+    def text(self, line):
+        self._append(json.dumps({"type": "text", "text": line}) + "\n")
+
+    def step(self, step_number, current_state, transition_event, transition_action, next_state):
+        self._append(json.dumps({
+            "type": "step", "step": step_number, "state": current_state,
+            "event": transition_event, "action": transition_action, "next": next_state,
+        }) + "\n")
+
+class BinaryTraceSink(TextTraceSink):
+    """
+    Compact binary trace. Each distinct string is sent once as a definition
+    record and later referred to by a 32-bit id, so a step costs 21 bytes.
+    (Event labels carry amounts and balances, so long traces can hold far
+    more than 65,536 distinct strings.)
+        0: define string  (id: u32, length: u32, utf-8 bytes)
+        1: separator      (title id: u32)
+        2: text           (line id: u32)
+        3: step           (step: u32, state, event, action, next ids: u32)
+    The string table is bounded too: after max_strings definitions it starts
+    again from id 0, and later definitions replace earlier ones.
+    Use read_binary_trace to turn it back into readable records.
+    """
+
+    _DEFINE = struct.Struct("<BII")
+    _REF = struct.Struct("<BI")
+    _STEP = struct.Struct("<BIIIII")
+
+    def __init__(self, stream=None, max_bytes=TRACE_BUFFER_BYTES, max_strings=1 << 16):
+        super().__init__(stream if stream is not None else sys.stdout.buffer, max_bytes)
+        self.max_strings = max_strings
+        self.ids = {}
+
+    def _intern(self, value):
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = len(self.ids)
+            self.ids[value] = string_id
+            encoded = value.encode()
+            # no _append: a definition never triggers a flush or reset by itself
+            self.parts.append(self._DEFINE.pack(0, string_id, len(encoded)) + encoded)
+            self.buffered += self._DEFINE.size + len(encoded)
+        return string_id
+
+    def _append(self, part):
+        # called once the record's strings are interned, so a reset never
+        # separates a reference from its definition
+        if self.max_strings is not None and len(self.ids) >= self.max_strings:
+            self.ids.clear()
+        super()._append(part)
+
+    def separator(self, title):
+        self._append(self._REF.pack(1, self._intern(title)))
+
+    def text(self, line):
+        self._append(self._REF.pack(2, self._intern(line)))
+
+    def step(self, step_number, current_state, transition_event, transition_action, next_state):
+        intern = self._intern
+        self._append(self._STEP.pack(
+            3, step_number, intern(current_state), intern(transition_event),
+            intern(transition_action), intern(next_state)))
+
+    def flush(self):
+        self.stream.write(b"".join(self.parts))
+        self.parts.clear()
+        self.buffered = 0
+
+def read_binary_trace(data):
+    """Yields (kind, fields) records from BinaryTraceSink output."""
+    strings = {}
+    offset = 0
+    while offset < len(data):
+        kind = data[offset]
+        if kind == 0:
+            _, string_id, length = BinaryTraceSink._DEFINE.unpack_from(data, offset)
+            offset += BinaryTraceSink._DEFINE.size
+            strings[string_id] = data[offset:offset + length].decode()
+            offset += length
+        elif kind in (1, 2):
+            _, string_id = BinaryTraceSink._REF.unpack_from(data, offset)
+            offset += BinaryTraceSink._REF.size
+            yield ("separator" if kind == 1 else "text", (strings[string_id],))
+        elif kind == 3:
+            _, step_number, *ids = BinaryTraceSink._STEP.unpack_from(data, offset)
+            offset += BinaryTraceSink._STEP.size
+            yield ("step", (step_number, *(strings[string_id] for string_id in ids)))
+        else:
+            raise ValueError(f"Unknown trace record type {kind} at offset {offset}")
+
+class NullTraceSink:
+    """Discards everything; isolates trace generation cost in benchmarks."""
+
+    def separator(self, title):
+        pass
+
+    def text(self, line):
+        pass
+
+    def step(self, step_number, current_state, transition_event, transition_action, next_state):
+        pass
+
+    def flush(self):
+        pass
+
+TRACE_SINKS = {
+    "text": TextTraceSink,
+    "jsonl": JsonLinesTraceSink,
+    "binary": BinaryTraceSink,
+    "null": NullTraceSink,
+}
+
+# --- STATES AND EVENTS (interned integer ids) ---
+
+STATE_NAMES = [
+    "WAITING FOR CARD",
+    "WAITING FOR PIN",
+    "AUTHENTICATED",
+    "PROCESSING WITHDRAWAL",
+    "TRANSACTION SUCCESS",
+    "DISPLAYING BALANCE",
+    "EJECTING CARD",
+    "CARD TRAPPED",
+    "FINAL NODE",
+]
+(WAITING_FOR_CARD, WAITING_FOR_PIN, AUTHENTICATED, PROCESSING_WITHDRAWAL,
+ TRANSACTION_SUCCESS, DISPLAYING_BALANCE, EJECTING_CARD, CARD_TRAPPED,
+ FINAL_NODE) = range(len(STATE_NAMES))
+
+EVENT_NAMES = [
+    "Insert Card",
+    "Enter PIN",
+    "Select Withdrawal",
+    "Enter Amount",
+    "Select Balance",
+    "Select Exit",
+    "OK",
+    "Card Removed",
+    "Timeout",
+]
+(INSERT_CARD, ENTER_PIN, SELECT_WITHDRAWAL, ENTER_AMOUNT, SELECT_BALANCE,
+ SELECT_EXIT, OK, CARD_REMOVED, TIMEOUT) = range(len(EVENT_NAMES))
+
+# Entry action descriptions, as written on the diagram
+ENTRY_ACTIONS = {
+    WAITING_FOR_CARD: "initialize system status; turn on screen",
+    WAITING_FOR_PIN: "reset PIN input buffer; start PIN entry timer",
+    AUTHENTICATED: "log successful authentication; reset timeout timer",
+    PROCESSING_WITHDRAWAL: "prompt for amount; start transaction timer",
+    TRANSACTION_SUCCESS: "disable keypad",
+    DISPLAYING_BALANCE: "retrieve account balance",
+    EJECTING_CARD: "eject card; print transaction receipt",
+    CARD_TRAPPED: "disable card reader; record session failure",
+}
+
+def state_label(state):
+    """Returns a state's name together with its entry action, as printed in the trace."""
+    entry = ENTRY_ACTIONS.get(state)
+    if entry is None:
+        return STATE_NAMES[state]
+    return f"{STATE_NAMES[state]} (Entry Action: {entry})"
+
+# --- SESSION CONTEXT, GUARDS AND ACTIONS ---
+
+class AtmContext:
+    """The extended state the guards and actions read and update."""
+
+    def __init__(self, balance=500, limit=200, pin=1234, max_attempts=3):
+        self.balance = balance
+        self.limit = limit
+        self.pin = pin
+        self.max_attempts = max_attempts
+        self.attempts = 0
+        self.input = None
+
+def _pin_correct(ctx):
+    return ctx.input == ctx.pin
+
+def _pin_retry(ctx):
+    return ctx.input != ctx.pin and ctx.attempts + 1 < ctx.max_attempts
+
+def _pin_exhausted(ctx):
+    return ctx.input != ctx.pin and ctx.attempts + 1 >= ctx.max_attempts
+
+def _amount_ok(ctx):
+    return ctx.input <= ctx.balance and ctx.input <= ctx.limit
+
+def _amount_rejected(ctx):
+    return ctx.input > ctx.balance or ctx.input > ctx.limit
+
+def _reset_attempts(ctx):
+    ctx.attempts = 0
+
+def _count_attempt(ctx):
+    ctx.attempts += 1
+
+def _debit_account(ctx):
+    ctx.balance -= ctx.input
+
+# --- TRANSITION TABLE ---
+
+# The event label is formatted before the action runs and the action label after
+# it, both from the context (e.g. the amount entered or the attempt number).
+Transition = namedtuple(
+    "Transition", "source event guard action target event_label action_label")
+
+TRANSITIONS = [
+    Transition(WAITING_FOR_CARD, INSERT_CARD, None, _reset_attempts, WAITING_FOR_PIN,
+               "Insert Card", "/ reset attempt counter; prompt for PIN"),
+    Transition(WAITING_FOR_PIN, ENTER_PIN, _pin_correct, None, AUTHENTICATED,
+               "Enter PIN [PIN is correct]", "/ display service menu"),
+    Transition(WAITING_FOR_PIN, ENTER_PIN, _pin_retry, _count_attempt, WAITING_FOR_PIN,
+               "Enter PIN [PIN is incorrect AND attempts < {max_attempts}]",
+               "/ increment attempt counter; prompt for PIN again (Attempt {attempts} of {max_attempts})"),
+    Transition(WAITING_FOR_PIN, ENTER_PIN, _pin_exhausted, _count_attempt, CARD_TRAPPED,
+               "Enter PIN [attempts = {max_attempts}]",
+               "/ trap card; display error: 'Maximum Attempts Reached'"),
+    Transition(AUTHENTICATED, SELECT_WITHDRAWAL, None, None, PROCESSING_WITHDRAWAL,
+               "Select Withdrawal", "/ prompt for amount"),
+    Transition(AUTHENTICATED, SELECT_BALANCE, None, None, DISPLAYING_BALANCE,
+               "Select Balance", "/ retrieve account balance"),
+    Transition(AUTHENTICATED, SELECT_EXIT, None, None, EJECTING_CARD,
+               "Select Exit", "/ eject card"),
+    Transition(PROCESSING_WITHDRAWAL, ENTER_AMOUNT, _amount_ok, _debit_account, TRANSACTION_SUCCESS,
+               "Enter Amount [${input} <= ${balance} balance AND ${input} <= ${limit} limit]",
+               "/ dispense cash; debit account; print receipt"),
+    Transition(PROCESSING_WITHDRAWAL, ENTER_AMOUNT, _amount_rejected, None, AUTHENTICATED,
+               "Enter Amount [${input} > ${balance} balance OR ${input} > ${limit} limit]",
+               "/ display error: 'Insufficient Funds or Limit Exceeded'"),
+    Transition(TRANSACTION_SUCCESS, OK, None, None, AUTHENTICATED,
+               "OK", "/ prompt for next transaction"),
+    Transition(DISPLAYING_BALANCE, SELECT_EXIT, None, None, EJECTING_CARD,
+               "Select Exit", "/ eject card; print receipt"),
+    Transition(EJECTING_CARD, CARD_REMOVED, None, None, FINAL_NODE,
+               "Timeout / Card Removed", "/ log session terminated"),
+    Transition(CARD_TRAPPED, OK, None, None, FINAL_NODE,
+               "OK (User presses button/Timeout)", "/ log closure notification"),
+    # Timer expiries (see STATE_TIMEOUTS)
+    Transition(WAITING_FOR_PIN, TIMEOUT, None, None, EJECTING_CARD,
+               "Timeout [PIN entry timer expired]", "/ cancel session; eject card"),
+    Transition(AUTHENTICATED, TIMEOUT, None, None, EJECTING_CARD,
+               "Timeout [timeout timer expired]", "/ eject card"),
+    Transition(PROCESSING_WITHDRAWAL, TIMEOUT, None, None, EJECTING_CARD,
+               "Timeout [transaction timer expired]", "/ cancel transaction; eject card"),
+    Transition(TRANSACTION_SUCCESS, TIMEOUT, None, None, EJECTING_CARD,
+               "Timeout", "/ eject card"),
+    Transition(DISPLAYING_BALANCE, TIMEOUT, None, None, EJECTING_CARD,
+               "Timeout", "/ eject card; print receipt"),
+    Transition(EJECTING_CARD, TIMEOUT, None, None, FINAL_NODE,
+               "Timeout / Card Removed", "/ log session terminated"),
+    Transition(CARD_TRAPPED, TIMEOUT, None, None, FINAL_NODE,
+               "OK (User presses button/Timeout)", "/ log closure notification"),
+]
+
+def compile_transitions(transitions):
+    """
+    Compiles transitions into a flat table indexed by state * len(EVENT_NAMES) + event.
+    Each slot holds the guarded alternatives for that pair, in declaration order.
+    """
+    table = [() for _ in range(len(STATE_NAMES) * len(EVENT_NAMES))]
+    for transition in transitions:
+        slot = transition.source * len(EVENT_NAMES) + transition.event
+        table[slot] = table[slot] + (transition,)
+    return table
+
+TRANSITION_TABLE = compile_transitions(TRANSITIONS)
+
+# --- STATE MACHINE ENGINE ---
+
+class AtmStateMachine:
+    """Executes the compiled transition table with O(1) dispatch per event."""
+
+    def __init__(self, context=None, table=TRANSITION_TABLE, tracer=None):
+        self.context = context if context is not None else AtmContext()
+        self.table = table
+        self.tracer = tracer
+        self.state = WAITING_FOR_CARD
+
+    def fire(self, event, value=None):
+        """
+        Delivers one event. Returns the transition taken, or None if no transition
+        for the current state accepts the event (the event is then ignored).
+        """
+        ctx = self.context
+        ctx.input = value
+        for transition in self.table[self.state * len(EVENT_NAMES) + event]:
+            if transition.guard is None or transition.guard(ctx):
+                if self.tracer is None:
+                    if transition.action is not None:
+                        transition.action(ctx)
+                else:
+                    event_label = transition.event_label.format_map(vars(ctx))
+                    if transition.action is not None:
+                        transition.action(ctx)
+                    self.tracer(transition, event_label,
+                                transition.action_label.format_map(vars(ctx)))
+                self.state = transition.target
+                return transition
+        return None
+
+# --- OPERATIONS AS DATA ---
+
+# quiet_steps: leading steps that are run but not printed (note is printed instead)
+Operation = namedtuple("Operation", "title events quiet_steps note")
+
+OPERATIONS = [
+    Operation("OPERATION 1: SUCCESSFUL WITHDRAWAL SEQUENCE",
+              [(INSERT_CARD, None), (ENTER_PIN, 1234), (SELECT_WITHDRAWAL, None),
+               (ENTER_AMOUNT, 100), (OK, None), (SELECT_EXIT, None), (CARD_REMOVED, None)],
+              0, None),
+    Operation("OPERATION 2: SUCCESSFUL BALANCE CHECK SEQUENCE",
+              [(INSERT_CARD, None), (ENTER_PIN, 1234), (SELECT_BALANCE, None),
+               (SELECT_EXIT, None), (CARD_REMOVED, None)],
+              3, "... (Initial steps 1-3 are identical: IDLE -> WAITING FOR CARD -> WAITING FOR PIN -> AUTHENTICATED) ..."),
+    Operation("OPERATION 3: FAILED AUTHENTICATION (CARD TRAPPED) SEQUENCE",
+              [(INSERT_CARD, None), (ENTER_PIN, 1111), (ENTER_PIN, 2222),
+               (ENTER_PIN, 3333), (OK, None)],
+              0, None),
+]
+
+def run_operation(operation, sink=None):
+    """
+    Replays an operation's events through the engine, recording every step in
+    'sink'. Without a sink the steps are printed with a single buffered write.
+    """
+    flush = sink is None
+    if flush:
+        sink = TextTraceSink()
+    sink.separator(operation.title)
+    if operation.note:
+        sink.text(operation.note)
     step = 1
 
-    # State: IDLE -> WAITING FOR CARD
-    print(f"[{step}] START: Initial Node -> WAITING FOR CARD")
-    print("    (Entry Action of WAITING FOR CARD: initialize system status; turn on screen)")
-    step += 1
-
-    # State: WAITING FOR CARD -> WAITING FOR PIN
-    print_step(step,
-               "WAITING FOR CARD",
-               "Insert Card",
-               "/ reset attempt counter; prompt for PIN",
-               "WAITING FOR PIN (Entry Action: reset PIN input buffer; start PIN entry timer)")
-    step += 1
-
-    # State: WAITING FOR PIN -> AUTHENTICATED
-    print_step(step,
-               "WAITING FOR PIN",
-               "Enter PIN [PIN is correct]",
-               "/ display service menu",
-               "AUTHENTICATED (Entry Action: log successful authentication; reset timeout timer)")
-    step += 1
-
-    # State: AUTHENTICATED -> PROCESSING WITHDRAWAL
-    print_step(step,
-               "AUTHENTICATED",
-               "Select Withdrawal",
-               "/ prompt for amount",
-               "PROCESSING WITHDRAWAL (Entry Action: prompt for amount; start transaction timer)")
-    step += 1
-
-    # State: PROCESSING WITHDRAWAL -> TRANSACTION SUCCESS
-    # Assuming user requests $100 and has $500 balance, within $200 limit
-    print_step(step,
-               "PROCESSING WITHDRAWAL",
-               "Enter Amount [$100 <= $500 balance AND $100 <= $200 limit]",
-               "/ dispense cash; debit account; print receipt",
-               "TRANSACTION SUCCESS (Entry Action: disable keypad)")
-    step += 1
-
-    # State: TRANSACTION SUCCESS -> AUTHENTICATED (User chooses to continue)
-    print_step(step,
-               "TRANSACTION SUCCESS",
-               "OK",
-               "/ prompt for next transaction",
-               "AUTHENTICATED (Entry Action: log successful authentication; reset timeout timer)")
-    step += 1
-
-    # State: AUTHENTICATED -> EJECTING CARD (User chooses to exit)
-    print_step(step,
-               "AUTHENTICATED",
-               "Select Exit",
-               "/ eject card",
-               "EJECTING CARD (Entry Action: eject card; print transaction receipt)")
-    step += 1
-
-    # State: EJECTING CARD -> FINAL NODE
-    print_step(step,
-               "EJECTING CARD",
-               "Timeout / Card Removed",
-               "/ log session terminated",
-               "FINAL NODE")
+    # State: Initial Node -> WAITING FOR CARD
+    if step > operation.quiet_steps:
+        sink.text(f"[{step}] START: Initial Node -> {STATE_NAMES[WAITING_FOR_CARD]}")
+        sink.text(f"    (Entry Action of {STATE_NAMES[WAITING_FOR_CARD]}: {ENTRY_ACTIONS[WAITING_FOR_CARD]})")
+
+    def trace(transition, event_label, action_label):
+        nonlocal step
+        step += 1
+        if step <= operation.quiet_steps:
+            return
+        if transition.target == transition.source:
+            next_state = f"{STATE_NAMES[transition.target]} (Self-Transition)"
+        else:
+            next_state = state_label(transition.target)
+        sink.step(step, STATE_NAMES[transition.source], event_label, action_label, next_state)
+
+    machine = AtmStateMachine(tracer=trace)
+    for event, value in operation.events:
+        machine.fire(event, value)
+    if flush:
+        sink.flush()
+
+# --- OPERATION 1: SUCCESSFUL WITHDRAWAL SEQUENCE ---
+
+def successful_withdrawal_sequence(sink=None):
+    """Prints the full sequence for a customer successfully withdrawing money."""
+    run_operation(OPERATIONS[0], sink)
 
 # --- OPERATION 2: SUCCESSFUL BALANCE CHECK SEQUENCE ---
 
-def successful_balance_check_sequence():
+def successful_balance_check_sequence(sink=None):
     """Prints the full sequence for a customer successfully checking their balance and exiting."""
-    print_separator("OPERATION 2: SUCCESSFUL BALANCE CHECK SEQUENCE")
-    step = 1
-
-    # Steps 1-3 are identical to the start of the withdrawal sequence (Initial Node to AUTHENTICATED)
-    print("... (Initial steps 1-3 are identical: IDLE -> WAITING FOR CARD -> WAITING FOR PIN -> AUTHENTICATED) ...")
-    step = 4 # Start from the AUTHENTICATED state
-
-    # State: AUTHENTICATED -> DISPLAYING BALANCE
-    print_step(step,
-               "AUTHENTICATED",
-               "Select Balance",
-               "/ retrieve account balance",
-               "DISPLAYING BALANCE (Entry Action: retrieve account balance)")
-    step += 1
-
-    # State: DISPLAYING BALANCE -> EJECTING CARD (User chooses to exit immediately)
-    print_step(step,
-               "DISPLAYING BALANCE",
-               "Select Exit",
-               "/ eject card; print receipt",
-               "EJECTING CARD (Entry Action: eject card; print transaction receipt)")
-    step += 1
-
-    # State: EJECTING CARD -> FINAL NODE
-    print_step(step,
-               "EJECTING CARD",
-               "Timeout / Card Removed",
-               "/ log session terminated",
-               "FINAL NODE")
+    run_operation(OPERATIONS[1], sink)
 
 # --- OPERATION 3: FAILED AUTHENTICATION SEQUENCE (CARD TRAPPED) ---
 
-def failed_authentication_sequence():
+def failed_authentication_sequence(sink=None):
     """Prints the full sequence for a customer failing authentication and having their card trapped."""
-    print_separator("OPERATION 3: FAILED AUTHENTICATION (CARD TRAPPED) SEQUENCE")
-    step = 1
+    run_operation(OPERATIONS[2], sink)
+
+# --- SESSION SIMULATOR ---
+
+# Probabilities: wrong_pin per PIN entry; withdrawal/balance per service-menu
+# choice (the remainder selects Exit). Withdrawal amounts are drawn in $20 steps
+# up to max_amount, so some exceed the limit or balance and are rejected.
+EventMix = namedtuple("EventMix", "wrong_pin withdrawal balance max_amount")
+DEFAULT_MIX = EventMix(wrong_pin=0.15, withdrawal=0.5, balance=0.3, max_amount=300)
+
+TRANSITION_IDS = {id(transition): i for i, transition in enumerate(TRANSITIONS)}
+
+def _simulate_chunk(sessions, seed, mix):
+    """
+    Runs 'sessions' independent sessions with a generator seeded by 'seed'.
+    Returns (visits per state id, firings per TRANSITIONS index).
+    """
+    rng = random.Random(seed).random
+    ctx = AtmContext()
+    machine = AtmStateMachine(ctx)
+    fire = machine.fire
+    visits = [0] * len(STATE_NAMES)
+    fired = [0] * len(TRANSITIONS)
+    transition_ids = TRANSITION_IDS
+    amount_steps = mix.max_amount // 20
+    menu_balance = mix.withdrawal + mix.balance
+
+    for _ in range(sessions):
+        machine.state = WAITING_FOR_CARD
+        ctx.balance = 500
+        visits[WAITING_FOR_CARD] += 1
+        path = [fire(INSERT_CARD)]
+        while machine.state == WAITING_FOR_PIN:
+            path.append(fire(ENTER_PIN, 0 if rng() < mix.wrong_pin else ctx.pin))
+        if machine.state == CARD_TRAPPED:
+            path.append(fire(OK))
+        while machine.state == AUTHENTICATED:
+            choice = rng()
+            if choice < mix.withdrawal:
+                path.append(fire(SELECT_WITHDRAWAL))
+                path.append(fire(ENTER_AMOUNT, 20 * (1 + int(rng() * amount_steps))))
+                if machine.state == TRANSACTION_SUCCESS:
+                    path.append(fire(OK))
+            elif choice < menu_balance:
+                path.append(fire(SELECT_BALANCE))
+                path.append(fire(SELECT_EXIT))
+            else:
+                path.append(fire(SELECT_EXIT))
+        if machine.state == EJECTING_CARD:
+            path.append(fire(CARD_REMOVED))
+        for transition in path:
+            visits[transition.target] += 1
+            fired[transition_ids[id(transition)]] += 1
+
+    return visits, fired
+
+def simulate_sessions(sessions, mix=DEFAULT_MIX, workers=None, seed=505, chunk_size=100_000):
+    """
+    Simulates independent ATM sessions across a process pool.
+
+    Work is split into fixed chunks seeded with seed + chunk index, so the
+    totals are deterministic no matter how many workers run them.
+    Returns (visits per state id, firings per TRANSITIONS index).
+    """
+    if not all(0 <= p <= 1 for p in (mix.wrong_pin, mix.withdrawal, mix.balance)):
+        raise ValueError("mix probabilities must be between 0 and 1")
+    # sessions only leave the menu through Exit, so it needs a non-zero share
+    # (a withdrawal-only mix would loop forever once the balance runs out)
+    if mix.withdrawal + mix.balance >= 1:
+        raise ValueError("withdrawal + balance probabilities must be below 1 to leave room for Exit")
+    chunks = [min(chunk_size, sessions - start) for start in range(0, sessions, chunk_size)]
+    visits = [0] * len(STATE_NAMES)
+    fired = [0] * len(TRANSITIONS)
+
+    def merge(result):
+        for i, count in enumerate(result[0]):
+            visits[i] += count
+        for i, count in enumerate(result[1]):
+            fired[i] += count
+
+    if workers == 1:
+        for index, size in enumerate(chunks):
+            merge(_simulate_chunk(size, seed + index, mix))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(_simulate_chunk, chunks,
+                                   [seed + index for index in range(len(chunks))],
+                                   [mix] * len(chunks)):
+                merge(result)
+    return visits, fired
+
+def print_simulation_report(sessions, visits, fired, elapsed):
+    """Prints state visit and transition counts from simulate_sessions."""
+    print_separator(f"SIMULATION: {sessions:,} SESSIONS IN {elapsed:.1f}s")
+    print("\n[State Visits]")
+    for state, count in sorted(enumerate(visits), key=lambda item: -item[1]):
+        print(f"  {STATE_NAMES[state]:<24} {count:>14,}")
+    print("\n[Transitions]")
+    for index, count in sorted(enumerate(fired), key=lambda item: -item[1]):
+        transition = TRANSITIONS[index]
+        edge = f"{STATE_NAMES[transition.source]} --{EVENT_NAMES[transition.event]}--> {STATE_NAMES[transition.target]}"
+        print(f"  {edge:<66} {count:>14,}")
 
-    # State: IDLE -> WAITING FOR CARD
-    print(f"[{step}] START: Initial Node -> WAITING FOR CARD")
-    print("    (Entry Action of WAITING FOR CARD: initialize system status; turn on screen)")
-    step += 1
-
-    # State: WAITING FOR CARD -> WAITING FOR PIN
-    print_step(step,
-               "WAITING FOR CARD",
-               "Insert Card",
-               "/ reset attempt counter; prompt for PIN",
-               "WAITING FOR PIN (Entry Action: reset PIN input buffer; start PIN entry timer)")
-    step += 1
-
-    # State: WAITING FOR PIN -> WAITING FOR PIN (Failure 1)
-    print_step(step,
-               "WAITING FOR PIN",
-               "Enter PIN [PIN is incorrect AND attempts < 3]",
-               "/ increment attempt counter; prompt for PIN again (Attempt 1 of 3)",
-               "WAITING FOR PIN (Self-Transition)")
-    step += 1
-
-    # State: WAITING FOR PIN -> WAITING FOR PIN (Failure 2)
-    print_step(step,
-               "WAITING FOR PIN",
-               "Enter PIN [PIN is incorrect AND attempts < 3]",
-               "/ increment attempt counter; prompt for PIN again (Attempt 2 of 3)",
-               "WAITING FOR PIN (Self-Transition)")
-    step += 1
-
-    # State: WAITING FOR PIN -> CARD TRAPPED (Failure 3)
-    print_step(step,
-               "WAITING FOR PIN",
-               "Enter PIN [attempts = 3]",
-               "/ trap card; display error: 'Maximum Attempts Reached'",
-               "CARD TRAPPED (Entry Action: disable card reader; record session failure)")
-    step += 1
-
-    # State: CARD TRAPPED -> FINAL NODE
-    print_step(step,
-               "CARD TRAPPED",
-               "OK (User presses button/Timeout)",
-               "/ log closure notification",
-               "FINAL NODE")
+# --- TIMERS AND EVENT LOOP ---
+
+# Virtual seconds before each state's timer fires a Timeout event. Every
+# transition cancels the pending timer and entering one of these states starts
+# a fresh one ("start PIN entry timer", "reset timeout timer", ...).
+STATE_TIMEOUTS = {
+    WAITING_FOR_PIN: 30.0,
+    AUTHENTICATED: 60.0,
+    PROCESSING_WITHDRAWAL: 45.0,
+    TRANSACTION_SUCCESS: 20.0,
+    DISPLAYING_BALANCE: 20.0,
+    EJECTING_CARD: 15.0,
+    CARD_TRAPPED: 10.0,
+}
+
+class TimerScheduler:
+    """
+    Heap-based timer queue on a virtual clock. The heap holds (deadline, seq,
+    handle) tuples where the handle is a mutable [callback, args] pair;
+    cancelling clears the callback and the entry is discarded when it reaches
+    the top (the heap is compacted when more than half of it is cancelled).
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = 0
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, delay, callback, *args):
+        """Runs callback(*args) 'delay' virtual seconds from now. Returns a handle for cancel()."""
+        self._seq += 1
+        handle = [callback, args]
+        heapq.heappush(self._heap, (self.now + delay, self._seq, handle))
+        return handle
+
+    def cancel(self, handle):
+        """Cancels a pending timer; cancelling a fired or cancelled timer does nothing."""
+        if handle[0] is None:
+            return
+        handle[0] = None
+        self._cancelled += 1
+        if self._cancelled > 1024 and self._cancelled * 2 > len(self._heap):
+            # in place, so a run_until that is mid-loop keeps popping this heap
+            self._heap[:] = [live for live in self._heap if live[2][0] is not None]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def run_until(self, deadline):
+        """Fires every timer due up to 'deadline' in order, then advances the clock to it."""
+        heap = self._heap
+        heappop = heapq.heappop
+        fired = 0
+        while heap and heap[0][0] <= deadline:
+            when, _, handle = heappop(heap)
+            callback = handle[0]
+            if callback is None:
+                self._cancelled -= 1
+                continue
+            handle[0] = None
+            self.now = when
+            callback(*handle[1])
+            fired += 1
+        self.now = deadline
+        return fired
+
+class AtmFleet:
+    """
+    Discrete-event simulation of many ATMs sharing one virtual clock. Customers
+    arrive, act after a short think time and sometimes walk away, in which case
+    the state timers move the session on to the final node.
+    """
+
+    def __init__(self, atms, mix=DEFAULT_MIX, seed=505, abandon=0.05,
+                 think_time=8.0, arrival_gap=300.0):
+        self.scheduler = TimerScheduler()
+        self.mix = mix
+        self.abandon = abandon
+        self.think_time = think_time
+        self.arrival_gap = arrival_gap
+        self.rng = random.Random(seed)
+        self.machines = [AtmStateMachine() for _ in range(atms)]
+        self.timers = [None] * atms
+        # each ATM's pending customer action, cancelled when a timeout moves the session on
+        self.actions = [None] * atms
+        self.abandoned = [False] * atms
+        self.events = 0
+        self.timeouts = 0
+        self.sessions = 0
+        for atm in range(atms):
+            self.actions[atm] = self.scheduler.schedule(self.rng.random() * arrival_gap,
+                                                        self._customer_acts, atm)
+
+    def _deliver(self, atm, event, value=None):
+        machine = self.machines[atm]
+        if machine.fire(event, value) is None:
+            return
+        self.events += 1
+        scheduler = self.scheduler
+        timer = self.timers[atm]
+        if timer is not None:
+            scheduler.cancel(timer)
+            self.timers[atm] = None
+        action = self.actions[atm]
+        if action is not None:
+            # only still pending when a timeout, not the customer, caused this event
+            scheduler.cancel(action)
+            self.actions[atm] = None
+
+        state = machine.state
+        if state == FINAL_NODE:
+            # session over: reset the machine and wait for the next customer
+            self.sessions += 1
+            machine.state = WAITING_FOR_CARD
+            machine.context.balance = 500
+            self.abandoned[atm] = False
+            self.actions[atm] = scheduler.schedule(self.rng.expovariate(1.0 / self.arrival_gap),
+                                                   self._customer_acts, atm)
+            return
+
+        duration = STATE_TIMEOUTS.get(state)
+        if duration is not None:
+            self.timers[atm] = scheduler.schedule(duration, self._timeout, atm)
+        if self.abandoned[atm]:
+            return
+        if self.rng.random() < self.abandon:
+            self.abandoned[atm] = True
+        else:
+            self.actions[atm] = scheduler.schedule(self.rng.random() * self.think_time,
+                                                   self._customer_acts, atm)
+
+    def _timeout(self, atm):
+        self.timers[atm] = None
+        self.timeouts += 1
+        self._deliver(atm, TIMEOUT)
+
+    def _customer_acts(self, atm):
+        self.actions[atm] = None
+        state = self.machines[atm].state
+        rng = self.rng.random
+        mix = self.mix
+        if state == WAITING_FOR_CARD:
+            self._deliver(atm, INSERT_CARD)
+        elif state == WAITING_FOR_PIN:
+            self._deliver(atm, ENTER_PIN, 0 if rng() < mix.wrong_pin else self.machines[atm].context.pin)
+        elif state == AUTHENTICATED:
+            choice = rng()
+            if choice < mix.withdrawal:
+                self._deliver(atm, SELECT_WITHDRAWAL)
+            elif choice < mix.withdrawal + mix.balance:
+                self._deliver(atm, SELECT_BALANCE)
+            else:
+                self._deliver(atm, SELECT_EXIT)
+        elif state == PROCESSING_WITHDRAWAL:
+            self._deliver(atm, ENTER_AMOUNT, 20 * (1 + int(rng() * (mix.max_amount // 20))))
+        elif state == DISPLAYING_BALANCE:
+            self._deliver(atm, SELECT_EXIT)
+        elif state == EJECTING_CARD:
+            self._deliver(atm, CARD_REMOVED)
+        else:
+            # TRANSACTION SUCCESS and CARD TRAPPED both wait for OK
+            self._deliver(atm, OK)
+
+    def run(self, seconds):
+        """Advances the virtual clock by 'seconds', firing every due customer action and timer."""
+        return self.scheduler.run_until(self.scheduler.now + seconds)
+
+def simulate_day(atms=5_000, seed=505):
+    """Runs a fleet through 24 virtual hours and prints the totals."""
+    fleet = AtmFleet(atms, seed=seed)
+    start = time.perf_counter()
+    fleet.run(24 * 3600)
+    elapsed = time.perf_counter() - start
+    print_separator(f"SIMULATED DAY: {atms:,} ATMS IN {elapsed:.1f}s")
+    print(f"  Sessions completed: {fleet.sessions:,}")
+    print(f"  Events fired:       {fleet.events:,}")
+    print(f"  Timeouts fired:     {fleet.timeouts:,}")
+    print(f"  Timers pending:     {len(fleet.scheduler):,}")
+
+# --- BENCHMARK ---
+
+def benchmark_engine(sessions=200_000):
+    """Measures untraced dispatch throughput by replaying all three operations."""
+    sequences = [operation.events for operation in OPERATIONS]
+    events = 0
+    start = time.perf_counter()
+    for i in range(sessions):
+        machine = AtmStateMachine()
+        fire = machine.fire
+        for event, value in sequences[i % 3]:
+            fire(event, value)
+        events += len(sequences[i % 3])
+    elapsed = time.perf_counter() - start
+    print(f"--- Engine Benchmark ({sessions:,} sessions) ---")
+    print(f"{events:,} events in {elapsed:.3f}s ({events / elapsed:,.0f} events/s)")
+
+def benchmark_timers(count=1_000_000):
+    """Measures scheduler insert, cancel and fire cost with 'count' pending timers."""
+    rng = random.Random(505)
+    delays = [rng.random() * 3600 for _ in range(count)]
+    scheduler = TimerScheduler()
+    noop = lambda: None
+
+    start = time.perf_counter()
+    timers = [scheduler.schedule(delay, noop) for delay in delays]
+    insert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for timer in timers[::2]:
+        scheduler.cancel(timer)
+    cancel_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fired = scheduler.run_until(3600)
+    fire_seconds = time.perf_counter() - start
+
+    cancelled = len(timers[::2])
+    print(f"--- Timer Benchmark ({count:,} timers) ---")
+    print(f"insert: {insert_seconds / count * 1e9:,.0f} ns/timer")
+    print(f"cancel: {cancel_seconds / cancelled * 1e9:,.0f} ns/timer")
+    print(f"fire:   {fire_seconds / fired * 1e9:,.0f} ns/timer ({fired:,} fired)")
+
+def benchmark_trace_sinks(repeats=20_000):
+    """Measures traced replay of all three operations into each buffered sink."""
+    import io
+    print(f"--- Trace Sink Benchmark ({repeats:,} x 3 operations) ---")
+    for name, sink_class in TRACE_SINKS.items():
+        stream = io.BytesIO() if sink_class is BinaryTraceSink else io.StringIO()
+        sink = sink_class(stream) if sink_class is not NullTraceSink else sink_class()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for operation in OPERATIONS:
+                run_operation(operation, sink)
+        sink.flush()
+        elapsed = time.perf_counter() - start
+        size = len(stream.getvalue()) if sink_class is not NullTraceSink else 0
+        print(f"{name:<7} {elapsed:.3f}s  {size:>12,} bytes")
 
 
 if __name__ == "__main__":
-    successful_withdrawal_sequence()
-    successful_balance_check_sequence()
-    failed_authentication_sequence()
+    parser = argparse.ArgumentParser(description="ATM State Machine Sequence Printer")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="measure engine dispatch and trace sink speed")
+    parser.add_argument("--trace-format", choices=sorted(TRACE_SINKS), default="text",
+                        help="output format for the operation traces (default: text)")
+    parser.add_argument("--simulate", type=int, metavar="SESSIONS",
+                        help="simulate this many independent sessions")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes for --simulate (default: CPU count)")
+    parser.add_argument("--simulate-day", type=int, metavar="ATMS",
+                        help="run this many ATMs through 24 virtual hours with timers")
+    parser.add_argument("--seed", type=int, default=505,
+                        help="base seed for --simulate and --simulate-day")
+    parser.add_argument("--wrong-pin", type=float, default=DEFAULT_MIX.wrong_pin,
+                        help="probability a PIN entry is wrong")
+    parser.add_argument("--withdrawal", type=float, default=DEFAULT_MIX.withdrawal,
+                        help="probability a menu choice is Withdrawal")
+    parser.add_argument("--balance", type=float, default=DEFAULT_MIX.balance,
+                        help="probability a menu choice is Balance")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_engine()
+        benchmark_trace_sinks()
+        benchmark_timers()
+        sys.exit(0)
+    if args.simulate_day:
+        simulate_day(args.simulate_day, args.seed)
+        sys.exit(0)
+    if args.simulate:
+        mix = EventMix(args.wrong_pin, args.withdrawal, args.balance, DEFAULT_MIX.max_amount)
+        start = time.perf_counter()
+        try:
+            visits, fired = simulate_sessions(args.simulate, mix, args.workers, args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+        print_simulation_report(args.simulate, visits, fired, time.perf_counter() - start)
+        sys.exit(0)
+
+    trace_sink = TRACE_SINKS[args.trace_format]()
+    successful_withdrawal_sequence(trace_sink)
+    successful_balance_check_sequence(trace_sink)
+    failed_authentication_sequence(trace_sink)
+    trace_sink.flush()